@@ -18,7 +18,7 @@ def main():
     print("Initializing Tracker database...")
     
     # Create database directory
-    db_path = settings.get_database_path()
+    db_path = settings.database_path
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Create all tables
@@ -1,18 +1,31 @@
 """API dependencies - authentication, database sessions"""
 
-from typing import Optional
+from typing import Generator, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from tracker.core.auth import verify_token
-from tracker.core.database import SessionLocal, get_db
+from tracker.core.database import get_threaded_sessionmaker
 from tracker.core.models import User
 
 security = HTTPBearer()
 
 
+def get_db() -> Generator[Session, None, None]:
+    """Get database session (dependency injection for FastAPI)
+
+    FastAPI runs sync dependencies in a threadpool, so sessions come from the
+    thread-shareable engine rather than the CLI one.
+    """
+    db = get_threaded_sessionmaker()()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
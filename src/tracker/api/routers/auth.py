@@ -11,9 +11,10 @@ from tracker.core.auth import (
     create_access_token,
     create_api_key,
     get_password_hash,
+    verify_and_update_password,
     verify_password,
 )
-from tracker.core.database import get_db
+from tracker.api.dependencies import get_db
 from tracker.core.models import User
 
 router = APIRouter()
@@ -91,11 +92,22 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
         )
     
     # Verify password
-    if not user.password_hash or not verify_password(credentials.password, user.password_hash):
+    if not user.password_hash:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password"
         )
+    valid, new_hash = verify_and_update_password(credentials.password, user.password_hash)
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid username or password"
+        )
+    
+    # Upgrade legacy bcrypt hashes to argon2
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
     
     # Create access token
     access_token = create_access_token(data={"sub": user.username})
@@ -4,10 +4,9 @@ from datetime import date, datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
-from tracker.api.dependencies import get_current_user
-from tracker.core.database import get_db
+from tracker.api.dependencies import get_current_user, get_db
 from tracker.core.models import User
 from tracker.core.schemas import EntryCreate, EntryUpdate, EntryResponse
 from tracker.services.entry_service import EntryService
@@ -54,8 +53,12 @@ def list_entries(
     """
     from tracker.core.models import DailyEntry
     
-    # Build query for user's entries
-    query = db.query(DailyEntry).filter(DailyEntry.user_id == current_user.id)
+    # Build query for user's entries (responses include the encrypted balances)
+    query = (
+        db.query(DailyEntry)
+        .options(undefer_group("encrypted"))
+        .filter(DailyEntry.user_id == current_user.id)
+    )
     
     # Apply date filters
     if start_date:
@@ -6,8 +6,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
-from tracker.api.dependencies import get_current_user
-from tracker.core.database import get_db
+from tracker.api.dependencies import get_current_user, get_db
 from tracker.core.models import User
 from tracker.services.export_service import ExportService
 
@@ -6,9 +6,8 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from tracker.api.dependencies import get_current_user
+from tracker.api.dependencies import get_current_user, get_db
 from tracker.config import settings
-from tracker.core.database import get_db
 from tracker.core.models import User
 from tracker.core.schemas import FeedbackResponse
 from tracker.services.entry_service import EntryService
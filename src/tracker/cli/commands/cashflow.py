@@ -344,7 +344,7 @@ def import_events(csv_file: str):
     try:
         user = get_default_user(db)
         
-        imported = 0
+        rows = []
         errors = []
         
         with open(csv_path, 'r') as f:
@@ -359,25 +359,24 @@ def import_events(csv_file: str):
                     amount = Decimal(row['amount'])
                     amount_cents = int(amount * 100)
                     
-                    # Create event
-                    event = CashFlowEvent(
-                        user_id=user.id,
-                        event_date=event_date,
-                        event_type=row['type'],
-                        provider=row.get('provider') or None,
-                        category=row.get('category') or None,
-                        amount_cents=amount_cents,
-                        account=row.get('account') or None,
-                        memo=row.get('memo') or None,
-                    )
-                    
-                    db.add(event)
-                    imported += 1
+                    rows.append({
+                        "user_id": user.id,
+                        "event_date": event_date,
+                        "event_type": row['type'],
+                        "provider": row.get('provider') or None,
+                        "category": row.get('category') or None,
+                        "amount_cents": amount_cents,
+                        "account": row.get('account') or None,
+                        "memo": row.get('memo') or None,
+                    })
                     
                 except Exception as e:
                     errors.append(f"Row {row_num}: {e}")
         
+        imported = len(rows)
         if imported > 0:
+            # One batched INSERT instead of a unit-of-work flush per event
+            CashFlowEvent.bulk_insert(db, rows)
             db.commit()
             console.print(
                 emphasize(
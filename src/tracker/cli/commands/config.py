@@ -446,7 +446,7 @@ def show():
     # Database
     console.print("[bold cyan]Database[/bold cyan]")
     console.print(f"  URL: {settings.database_url}")
-    console.print(f"  Path: {settings.get_database_path()}")
+    console.print(f"  Path: {settings.database_path}")
     encryption_icon = icon('✅', '') if settings.encryption_key else icon('❌', '')
     encryption_label = "Enabled" if settings.encryption_key else "Not configured"
     console.print(f"  Encryption: {(encryption_icon + ' ') if encryption_icon else ''}{encryption_label}")
@@ -47,7 +47,8 @@ def list(days, limit, start, end):
             user.id,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            include_encrypted=False
         )
         
         if not entries:
@@ -1,6 +1,5 @@
 """Onboarding wizard for first-time setup"""
 
-import json
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
@@ -552,7 +551,7 @@ def apply_configuration(config: Dict[str, Any]):
                 return obj
             
             baseline = serialize_decimal(baseline)
-            user.settings = json.dumps(baseline)
+            user.settings = baseline
             db.commit()
             console.print("  ✓ Saved baseline to database")
     finally:
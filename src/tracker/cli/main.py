@@ -32,13 +32,17 @@ def init():
     from tracker.core.database import Base, engine, init_db
     from tracker.core.models import User
     from tracker.config import settings
+    from tracker.core.paths import TrackerPaths
 
     console.print(
         f"[bold blue]{icon('🚀', 'Init')} Initializing Tracker...[/bold blue]"
     )
 
+    # Create all application directories up front
+    TrackerPaths.bootstrap()
+
     # Create database directory
-    db_path = settings.get_database_path()
+    db_path = settings.database_path
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create tables
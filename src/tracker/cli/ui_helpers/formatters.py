@@ -1,9 +1,25 @@
 """Shared UI formatters for Tracker CLI"""
 
 import os
+import re
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
 from typing import Dict, Any, List
-from rich.table import Table
+
 from rich import box
+from rich.console import Console as RichConsole
+from rich.table import Table
+from rich.text import Text
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
 
 from tracker.cli.ui.console import get_console
 from typing import TYPE_CHECKING, Any
@@ -11,6 +27,12 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from tracker.services.natural_commands import ParsedIntent
 
+# "Change <field> from <before> to <after>" descriptions produced by AdjustmentDiff
+_CHANGE_RE = re.compile(r"^(?:Change |Set )?(?P<field>.+?) from (?P<before>.+?) to (?P<after>.+)$")
+
+_MONEY_FMT = "${:.2f}"
+_DATE_FMT = "%m/%d"
+
 
 def render_diff(diff) -> str:
     """Render diff preview as a table
@@ -32,20 +54,13 @@ def render_diff(diff) -> str:
     changes = diff.changes
     for change in changes:
         # Parse change description for table
-        if "from" in change.lower():
-            parts = change.split(" from ")
-            if len(parts) == 2:
-                field = parts[0].replace("Change ", "").replace("Set ", "")
-                before_after = parts[1].split(" to ")
-                if len(before_after) == 2:
-                    table.add_row(field, before_after[0], before_after[1], "Today")
+        match = _CHANGE_RE.match(change)
+        if match:
+            table.add_row(match["field"], match["before"], match["after"], "Today")
         else:
             table.add_row(change, "-", "Applied", "Today")
 
     # Capture table output
-    from io import StringIO
-    from rich.console import Console as RichConsole
-
     string_buffer = StringIO()
     temp_console = RichConsole(file=string_buffer, width=console.width, legacy_windows=False)
     temp_console.print(table)
@@ -99,20 +114,21 @@ def render_forecast(rows: List[Dict[str, Any]]) -> str:
 
         # Format balance
         balance = day.get('end_balance_bank', 0)
-        balance_str = f"${balance:.2f}" if balance >= 0 else f"[red]${balance:.2f}[/]"
+        balance_str = _MONEY_FMT.format(balance)
+        balance_cell = balance_str if balance >= 0 else Text(balance_str, style="red")
+
+        date = day.get('date', '')
+        date_str = date.strftime(_DATE_FMT) if hasattr(date, 'strftime') else str(date)
 
         table.add_row(
-            day.get('date', '').strftime("%m/%d") if hasattr(day.get('date'), 'strftime') else str(day.get('date', '')),
+            date_str,
             day.get('day_name', '')[:3],
             events_str,
-            f"${day_change:.2f}",
-            balance_str,
+            _MONEY_FMT.format(day_change),
+            balance_cell,
         )
 
     # Capture table output
-    from io import StringIO
-    from rich.console import Console as RichConsole
-
     string_buffer = StringIO()
     temp_console = RichConsole(file=string_buffer, width=console.width, legacy_windows=False)
     temp_console.print(table)
@@ -127,9 +143,6 @@ def render_audit_summary() -> str:
         Formatted audit summary string
     """
     from tracker.config import get_config_dir
-    import json
-    from pathlib import Path
-    from datetime import datetime
 
     console = get_console()
     audit_dir = get_config_dir() / "audits"
@@ -138,13 +151,13 @@ def render_audit_summary() -> str:
         return "[dim]No audits found[/dim]"
 
     # Get last 3 audit files
-    audit_files = sorted(audit_dir.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)[:3]
+    with os.scandir(audit_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+    audit_files = sorted(entries, key=lambda entry: entry.stat().st_mtime, reverse=True)[:3]
 
     if not audit_files:
         return "[dim]No audits found[/dim]"
 
-    from rich.table import Table
-
     table = Table(box=None, show_header=True, header_style="bold cyan")
     table.add_column("Date", style="cyan", width=12)
     table.add_column("Action", style="white", width=25)
@@ -152,8 +165,7 @@ def render_audit_summary() -> str:
 
     for audit_file in audit_files:
         try:
-            with open(audit_file, 'r') as f:
-                audit_data = json.load(f)
+            audit_data = _loads(Path(audit_file.path).read_bytes())
 
             timestamp = audit_data.get('timestamp', '')
             if timestamp:
@@ -177,9 +189,6 @@ def render_audit_summary() -> str:
             table.add_row("Error", "Could not read audit", "")
 
     # Capture table output
-    from io import StringIO
-    from rich.console import Console as RichConsole
-
     string_buffer = StringIO()
     temp_console = RichConsole(file=string_buffer, width=console.width, legacy_windows=False)
     temp_console.print(table)
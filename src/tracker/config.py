@@ -1,6 +1,6 @@
 """Configuration management"""
 
-import os
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +20,15 @@ def get_env_file_path() -> Path:
     return TrackerPaths.get_env_file_path()
 
 
+# Settings attribute holding the API key for each provider.
+# Local models don't need API keys, so "local" is intentionally absent.
+_PROVIDER_KEY_ATTR = {
+    "openai": "openai_api_key",
+    "anthropic": "anthropic_api_key",
+    "openrouter": "openrouter_api_key",
+}
+
+
 class Settings(BaseSettings):
     """Application settings"""
 
@@ -68,27 +77,26 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
 
-    def get_database_path(self) -> Path:
-        """Get resolved database path"""
+    @cached_property
+    def database_path(self) -> Path:
+        """Resolved database path (computed once per settings instance)"""
         if self.database_url and self.database_url.startswith("sqlite:///"):
             # Use provided path
-            url = self.database_url.replace("sqlite:///", "")
-            return Path(os.path.expanduser(url))
+            url = self.database_url.removeprefix("sqlite:///")
+            return Path(url).expanduser()
         else:
             # Use default cross-platform path
             return TrackerPaths.get_database_path()
 
+    @cached_property
+    def ai_api_key(self) -> Optional[str]:
+        """API key for the configured provider (provider config is process-static)"""
+        key_attr = _PROVIDER_KEY_ATTR.get(self.ai_provider)
+        return getattr(self, key_attr) if key_attr else None
+
     def get_ai_api_key(self) -> Optional[str]:
         """Get API key for configured provider"""
-        if self.ai_provider == "openai":
-            return self.openai_api_key
-        elif self.ai_provider == "anthropic":
-            return self.anthropic_api_key
-        elif self.ai_provider == "openrouter":
-            return self.openrouter_api_key
-        elif self.ai_provider == "local":
-            return None  # Local models don't need API keys
-        return None
+        return self.ai_api_key
 
 
 # Global settings instance
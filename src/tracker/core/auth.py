@@ -1,18 +1,42 @@
 """Authentication utilities for JWT tokens"""
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from passlib.context import CryptContext
 
 from tracker.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2 for new hashes, legacy bcrypt hashes still
+# verify and are rehashed on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+)
 
 # JWT configuration
 ALGORITHM = "HS256"
+_ALGORITHMS = [ALGORITHM]
+_SECRET_BYTES = settings.jwt_secret.encode()
+_DEFAULT_EXPIRY = timedelta(days=settings.jwt_expiry_days)
+
+# Last (epoch second, aware datetime) pair handed out by _now_utc
+_now_cache: tuple[int, datetime] = (0, datetime.fromtimestamp(0, timezone.utc))
+
+
+def _now_utc() -> datetime:
+    """Current UTC time at one-second resolution (JWT claims are whole seconds)"""
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.fromtimestamp(second, timezone.utc))
+    return _now_cache[1]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -20,6 +44,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one is outdated
+    
+    Returns:
+        (is_valid, new_hash) where new_hash is None unless a rehash is needed
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password"""
     return pwd_context.hash(password)
@@ -38,14 +74,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=settings.jwt_expiry_days)
-    
+    expire = _now_utc() + (expires_delta or _DEFAULT_EXPIRY)
     to_encode.update({"exp": expire})
     
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -60,9 +92,9 @@ def verify_token(token: str) -> Optional[dict]:
         Decoded token payload or None if invalid
     """
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
         return payload
-    except JWTError:
+    except PyJWTError:
         return None
 
 
@@ -1,13 +1,17 @@
 """Database connection and session management"""
 
 import os
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import DateTime, create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.functions import FunctionElement
 
 from tracker.config import settings
 
@@ -15,37 +19,77 @@ from tracker.config import settings
 Base = declarative_base()
 
 
-@event.listens_for(Engine, "connect")
-def enable_sqlite_foreign_keys(dbapi_conn, connection_record):
-    """Enable foreign key constraints for SQLite"""
-    if "sqlite" in str(dbapi_conn):
-        cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database
+
+    Used for timestamp defaults so inserts and updates don't call back into
+    Python per row. Keeps sub-second precision on SQLite, whose
+    CURRENT_TIMESTAMP stops at whole seconds.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f', 'now'))"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+_SQLITE_PRAGMAS = """
+PRAGMA foreign_keys=ON;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+PRAGMA busy_timeout=5000;
+"""
 
 
 @event.listens_for(Engine, "connect")
-def enable_wal_mode(dbapi_conn, connection_record):
-    """Enable WAL mode for better concurrent access"""
-    if "sqlite" in str(dbapi_conn):
+def _sqlite_connect(dbapi_conn, _):
+    """Enable foreign keys, WAL mode and performance pragmas for SQLite
+
+    synchronous=NORMAL is safe with WAL and avoids an fsync on every commit;
+    mmap_size is 256 MB and cache_size is 64 MB.
+    """
+    if isinstance(dbapi_conn, sqlite3.Connection):
         cursor = dbapi_conn.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.executescript(_SQLITE_PRAGMAS)
         cursor.close()
 
 
-def get_engine():
-    """Create and configure SQLAlchemy engine"""
+def get_engine(for_async: bool = False):
+    """Create and configure SQLAlchemy engine
+
+    Args:
+        for_async: Allow connections to be shared across threads. Only the
+            API/MCP paths need this; the single-threaded CLI keeps SQLite's
+            default same-thread check.
+    """
     # Resolve database path
-    db_path = settings.get_database_path()
+    db_path = settings.database_path
 
     # Create parent directory if it doesn't exist
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create engine
     database_url = f"sqlite:///{db_path}"
+    connect_args = {"check_same_thread": False} if for_async else {}
     engine = create_engine(
         database_url,
-        connect_args={"check_same_thread": False},  # Allow multi-threaded access
+        connect_args=connect_args,
         echo=False,  # Set to True for SQL logging
     )
 
@@ -57,8 +101,14 @@ engine = get_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@lru_cache(maxsize=None)
+def get_threaded_sessionmaker() -> sessionmaker:
+    """Session factory bound to a thread-shareable engine (built on first use)"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine(for_async=True))
+
+
 def get_db() -> Generator[Session, None, None]:
-    """Get database session (dependency injection for FastAPI)"""
+    """Get database session"""
     db = SessionLocal()
     try:
         yield db
@@ -2,18 +2,48 @@
 
 import base64
 import os
-from typing import Optional
+from typing import List, Optional, Sequence, Union
 
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from tracker.config import settings
 
 
+# Length of the random nonce prepended to AES-GCM ciphertexts
+NONCE_SIZE = 12
+
+# HKDF context separating the AES-GCM key from the Fernet key
+AESGCM_KEY_INFO = b"tracker-aesgcm-v1"
+
+
+def _derive_aesgcm_key(fernet_key: bytes) -> bytes:
+    """Derive the AES-256-GCM key from the Fernet key
+
+    Fernet already uses the raw key bytes for its own signing and encryption
+    keys, so the AES-GCM key must not reuse them directly.
+    """
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=AESGCM_KEY_INFO,
+    ).derive(base64.urlsafe_b64decode(fernet_key))
+
+
 class EncryptionService:
-    """Service for encrypting/decrypting sensitive fields"""
+    """Service for encrypting/decrypting sensitive fields
+
+    Text columns use Fernet tokens (base64 text). Binary columns use AES-256-GCM
+    with a key derived from the Fernet key via HKDF, stored as raw
+    ``nonce || ciphertext`` bytes.
+    """
 
     def __init__(self):
         self._fernet: Optional[Fernet] = None
+        self._aesgcm: Optional[AESGCM] = None
         self._initialize()
 
     def _initialize(self):
@@ -31,6 +61,7 @@ class EncryptionService:
             if isinstance(key, str):
                 key = key.encode()
             self._fernet = Fernet(key)
+            self._aesgcm = AESGCM(_derive_aesgcm_key(key))
         except Exception as e:
             # If key is invalid, generate a new one
             print(f"⚠️  Invalid encryption key, generating new one: {e}")
@@ -38,6 +69,7 @@ class EncryptionService:
             key_str = new_key.decode()
             print(f"⚠️  Add to .env: ENCRYPTION_KEY={key_str}")
             self._fernet = Fernet(new_key)
+            self._aesgcm = AESGCM(_derive_aesgcm_key(new_key))
 
     def encrypt(self, value: Optional[str]) -> Optional[str]:
         """Encrypt a string value"""
@@ -50,6 +82,70 @@ class EncryptionService:
         encrypted = self._fernet.encrypt(str(value).encode())
         return base64.urlsafe_b64encode(encrypted).decode()
 
+    def encrypt_bytes(self, value: Union[str, bytes, None]) -> Optional[bytes]:
+        """Encrypt a string (or already-encoded bytes) to raw bytes for a binary column"""
+        if value is None:
+            return None
+
+        if not self._aesgcm:
+            raise RuntimeError("Encryption not initialized")
+
+        data = value if isinstance(value, bytes) else str(value).encode()
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._aesgcm.encrypt(nonce, data, None)
+
+    def encrypt_many_bytes(self, values: Sequence[Optional[str]]) -> List[Optional[bytes]]:
+        """Encrypt several values to raw bytes with one cipher and one urandom read"""
+        if not self._aesgcm:
+            raise RuntimeError("Encryption not initialized")
+
+        aesgcm = self._aesgcm
+        nonces = os.urandom(NONCE_SIZE * len(values))
+        encrypted: List[Optional[bytes]] = []
+        for i, value in enumerate(values):
+            if value is None:
+                encrypted.append(None)
+                continue
+            nonce = nonces[i * NONCE_SIZE:(i + 1) * NONCE_SIZE]
+            encrypted.append(nonce + aesgcm.encrypt(nonce, str(value).encode(), None))
+        return encrypted
+
+    def decrypt_bytes(self, encrypted_value: Optional[bytes]) -> Optional[str]:
+        """Decrypt raw bytes produced by encrypt_bytes"""
+        decrypted = self.decrypt_raw_bytes(encrypted_value)
+        return decrypted.decode() if decrypted is not None else None
+
+    def decrypt_raw_bytes(self, encrypted_value: Optional[bytes]) -> Optional[bytes]:
+        """Decrypt raw bytes produced by encrypt_bytes without decoding the plaintext"""
+        if encrypted_value is None:
+            return None
+
+        if not self._aesgcm:
+            raise RuntimeError("Encryption not initialized")
+
+        try:
+            return self._open(encrypted_value)
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {e}")
+
+    def _open(self, encrypted_value: bytes) -> bytes:
+        data = memoryview(encrypted_value)
+        return self._aesgcm.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], None)
+
+    def decrypt_many_bytes(self, values: Sequence[Optional[bytes]]) -> List[Optional[str]]:
+        """Decrypt several values produced by encrypt_bytes with one cipher"""
+        if not self._aesgcm:
+            raise RuntimeError("Encryption not initialized")
+
+        open_ = self._open
+        decrypted: List[Optional[str]] = []
+        try:
+            for value in values:
+                decrypted.append(open_(value).decode() if value is not None else None)
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {e}")
+        return decrypted
+
     def decrypt(self, encrypted_value: Optional[str]) -> Optional[str]:
         """Decrypt an encrypted string"""
         if encrypted_value is None:
@@ -66,5 +162,26 @@ class EncryptionService:
             raise ValueError(f"Decryption failed: {e}")
 
 
-# Global encryption service instance
-encryption_service = EncryptionService()
+class _LazyEncryptionService:
+    """Proxy that builds the real EncryptionService on first attribute access
+
+    Keeps key loading/generation off the import path for commands that never
+    touch encrypted fields. Methods are bound onto the proxy the first time
+    they are looked up, so later calls skip __getattr__ entirely.
+    """
+
+    def __init__(self):
+        self._service: Optional[EncryptionService] = None
+
+    def __getattr__(self, name: str):
+        service = self._service
+        if service is None:
+            service = self._service = EncryptionService()
+        value = getattr(service, name)
+        if callable(value):
+            setattr(self, name, value)
+        return value
+
+
+# Global encryption service instance (initialized on first use)
+encryption_service = _LazyEncryptionService()
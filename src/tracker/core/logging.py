@@ -1,18 +1,56 @@
 """Logging configuration for the Tracker application."""
 
+import atexit
+import functools
 import logging
+import os
+import queue
+import re
 import sys
+import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import platform
 
+from tracker import __version__
 from tracker.config import settings
 
+_PLATFORM = (platform.system(), platform.release())
+_IS_WINDOWS = _PLATFORM[0] == "Windows"
 
+_TRACKER_LOGGER = logging.getLogger("tracker")
+_LEVEL_MAP = logging.getLevelNamesMapping()
+
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_SIMPLE_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+# Background listener that owns the file handler (see setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
+# (log_level, log_file, console, verbose) of the last setup_logging call
+_active_config: Optional[tuple] = None
+
+# Keys whose values are redacted by sanitize_log_data (substring match)
+_SENSITIVE_KEYS = frozenset({
+    'password', 'api_key', 'secret', 'token',
+    'cash_on_hand', 'bank_balance', 'debts_total',
+    'encryption_key', 'jwt_secret',
+})
+_SENSITIVE_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_SENSITIVE_KEYS))),
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_log_dir() -> Path:
-    """Get the log directory path, creating it if necessary."""
-    if platform.system() == "Windows":
+    """Get the log directory path, creating it on first call."""
+    if _IS_WINDOWS:
         log_dir = Path.home() / "AppData" / "Local" / "tracker" / "logs"
     else:
         log_dir = Path.home() / ".local" / "share" / "tracker" / "logs"
@@ -21,165 +59,176 @@ def get_log_dir() -> Path:
     return log_dir
 
 
-def setup_logging(
-    level: Optional[str] = None,
-    log_file: bool = True,
-    console: bool = True,
-    verbose: bool = False
-) -> None:
+class FastRotatingFileHandler(RotatingFileHandler):
     """
-    Configure logging for the application.
+    RotatingFileHandler with a cheaper rollover check (see CPython gh-105623).
     
-    Args:
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        log_file: Whether to log to file
-        console: Whether to log to console
-        verbose: Enable verbose output (sets DEBUG level)
+    The stock check stats the log path on every record and calls
+    ``stream.tell()``, which flushes the text buffer. Here the file size is
+    tracked in a counter (read from disk on open, then advanced by each
+    record's encoded length), and the regular-file test runs only when the
+    limit is reached, cached until the next rollover.
     """
-    # Determine log level
-    if verbose:
-        log_level = logging.DEBUG
-    elif level:
-        log_level = getattr(logging, level.upper(), logging.INFO)
-    else:
-        log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-    
-    # Create logger
-    logger = logging.getLogger("tracker")
-    logger.setLevel(log_level)
-    
-    # Clear existing handlers
-    logger.handlers.clear()
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(levelname)s: %(message)s'
-    )
-    
-    # Console handler
-    if console:
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(simple_formatter if not verbose else detailed_formatter)
-        logger.addHandler(console_handler)
-    
-    # File handler with rotation
-    if log_file:
-        log_path = get_log_dir() / "tracker.log"
-        file_handler = RotatingFileHandler(
-            log_path,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
-    
-    # Log startup information
-    logger.info(f"Tracker v{__import__('tracker').__version__} starting")
-    logger.info(f"Platform: {platform.system()} {platform.release()}")
-    logger.info(f"Python: {sys.version}")
-    logger.debug(f"Log level: {logging.getLevelName(log_level)}")
-    logger.debug(f"Log directory: {get_log_dir()}")
+    _is_regular_file: Optional[bool] = None
+    
+    # Bytes in the current log file, and the size of the record being emitted
+    _size: int = 0
+    _record_size: int = 0
+    
+    def _open(self):
+        stream = super()._open()
+        self._reset_size()
+        return stream
+    
+    def _reset_size(self) -> None:
+        try:
+            self._size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._size = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        if msg.isascii():
+            self._record_size = len(msg)
+        else:
+            self._record_size = len(msg.encode(self.stream.encoding, "replace"))
+        if self._size + self._record_size < self.maxBytes:
+            return False
+        # Never rollover anything other than regular files (bpo-45401)
+        if self._is_regular_file is None:
+            self._is_regular_file = os.path.isfile(self.baseFilename)
+        return self._is_regular_file
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self._record_size = 0
+        super().emit(record)
+        self._size += self._record_size
+    
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._is_regular_file = None
+        # With delay=True no stream is reopened here; the next file is empty
+        if self.stream is None:
+            self._size = 0
 
 
-def get_logger(name: str) -> logging.Logger:
+class BufferedRotatingFileHandler(FastRotatingFileHandler):
     """
-    Get a logger instance for a module.
+    Rotating file handler that batches writes in a 64KB buffer.
     
-    Args:
-        name: Module name (usually __name__)
-        
-    Returns:
-        Logger instance
+    The stream is flushed every ``flush_interval`` seconds, on close, and
+    immediately for WARNING and above.
     """
-    return logging.getLogger(f"tracker.{name}")
-
-
-class LogContext:
-    """Context manager for temporary log level changes."""
-    
-    def __init__(self, level: str):
-        self.new_level = getattr(logging, level.upper())
-        self.logger = logging.getLogger("tracker")
-        self.old_level = None
-    
-    def __enter__(self):
-        self.old_level = self.logger.level
-        self.logger.setLevel(self.new_level)
-        return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.logger.setLevel(self.old_level)
+    buffer_size = 64 * 1024
+    flush_interval = 30.0
+    
+    def __init__(self, *args, **kwargs):
+        self._flush_timer: Optional[threading.Timer] = None
+        self._stopped = False
+        super().__init__(*args, **kwargs)
+        self._schedule_flush()
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._reset_size()
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self._flush_stream()
+    
+    def flush(self) -> None:
+        # StreamHandler.emit() flushes after every record; leave that to
+        # the timer so small writes are batched.
+        pass
+    
+    def _flush_stream(self) -> None:
+        with self.lock:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+    
+    def _schedule_flush(self) -> None:
+        if self._stopped:
+            return
+        self._flush_timer = threading.Timer(self.flush_interval, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _periodic_flush(self) -> None:
+        self._flush_stream()
+        self._schedule_flush()
+    
+    def close(self) -> None:
+        self._stopped = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_stream()
+        super().close()
 
 
-def log_exception(logger: logging.Logger, exc: Exception, context: str = "") -> None:
+class RawStderrHandler(logging.StreamHandler):
     """
-    Log an exception with full traceback.
+    Console handler that writes UTF-8 bytes straight to stderr's binary buffer.
     
-    Args:
-        logger: Logger instance
-        exc: Exception to log
-        context: Additional context about where the error occurred
+    Skips the text layer's codec and newline translation. On a terminal
+    every record is flushed so console output appears as it happens. When
+    stderr is redirected, the buffer is flushed for WARNING and above and
+    on close, and lower levels go out with the next flush. Falls back to plain StreamHandler behaviour when stderr
+    has no binary buffer (e.g. when replaced by a StringIO).
     """
-    import traceback
     
-    error_msg = f"Exception in {context}: {exc}" if context else f"Exception: {exc}"
-    logger.error(error_msg)
-    logger.debug(f"Traceback:\n{traceback.format_exc()}")
-
+    def __init__(self):
+        buffer = getattr(sys.stderr, "buffer", None)
+        super().__init__(buffer if buffer is not None else sys.stderr)
+        self._raw = buffer is not None
+        self._interactive = False
+        if self._raw:
+            # Push out anything already written through the text layer
+            sys.stderr.flush()
+            self.terminator = os.linesep
+            try:
+                self._interactive = buffer.isatty()
+            except (AttributeError, ValueError):
+                pass
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if not self._raw:
+            super().emit(record)
+            return
+        try:
+            self.stream.write((self.format(record) + self.terminator).encode("utf-8", "backslashreplace"))
+            if self._interactive or record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
-def sanitize_log_data(data: dict) -> dict:
-    """
-    Remove sensitive information from data before logging.
-    
-    Args:
-        data: Dictionary containing data to log
-        
-    Returns:
-        Sanitized dictionary
-    """
-    sensitive_keys = {
-        'password', 'api_key', 'secret', 'token', 
-        'cash_on_hand', 'bank_balance', 'debts_total',
-        'encryption_key', 'jwt_secret'
-    }
-    
-    sanitized = {}
-    for key, value in data.items():
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
-            sanitized[key] = "***REDACTED***"
-        elif isinstance(value, dict):
-            sanitized[key] = sanitize_log_data(value)
-        else:
-            sanitized[key] = value
-    
-    return sanitized
-import logging
-import sys
-from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
-import platform
 
-from tracker.config import settings
+def _stop_queue_listener() -> None:
+    """Drain queued records and stop the background file writer."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
 
 
-def get_log_dir() -> Path:
-    """Get the log directory path, creating it if necessary."""
-    if platform.system() == "Windows":
-        log_dir = Path.home() / "AppData" / "Local" / "tracker" / "logs"
-    else:
-        log_dir = Path.home() / ".local" / "share" / "tracker" / "logs"
-    
-    log_dir.mkdir(parents=True, exist_ok=True)
-    return log_dir
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(
@@ -205,51 +254,58 @@ def setup_logging(
     else:
         log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     
-    # Create logger
-    logger = logging.getLogger("tracker")
+    # Nothing to do if already configured the same way
+    global _active_config
+    config = (log_level, log_file, console, verbose)
+    logger = _TRACKER_LOGGER
+    if config == _active_config and logger.handlers:
+        return
+    
     logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Close and clear existing handlers
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
-    
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    simple_formatter = logging.Formatter(
-        '%(levelname)s: %(message)s'
-    )
+    _stop_queue_listener()
+    _active_config = config
     
     # Console handler
     if console:
-        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler = RawStderrHandler()
         console_handler.setLevel(log_level)
-        console_handler.setFormatter(simple_formatter if not verbose else detailed_formatter)
+        console_handler.setFormatter(_SIMPLE_FORMATTER if not verbose else _DETAILED_FORMATTER)
         logger.addHandler(console_handler)
     
-    # File handler with rotation
+    # File handler with rotation, written from a background thread so
+    # callers never block on disk I/O
     if log_file:
+        global _queue_listener
         log_path = get_log_dir() / "tracker.log"
-        file_handler = RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_path,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_DETAILED_FORMATTER)
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
     
     # Log startup information
-    logger.info(f"Tracker v{__import__('tracker').__version__} starting")
-    logger.info(f"Platform: {platform.system()} {platform.release()}")
-    logger.info(f"Python: {sys.version}")
-    logger.debug(f"Log level: {logging.getLevelName(log_level)}")
-    logger.debug(f"Log directory: {get_log_dir()}")
+    logger.info("Tracker v%s starting", __version__)
+    logger.info("Platform: %s %s", *_PLATFORM)
+    logger.info("Python: %s", sys.version)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Log level: %s", logging.getLevelName(log_level))
+        logger.debug("Log directory: %s", get_log_dir())
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -267,8 +323,8 @@ class LogContext:
     """Context manager for temporary log level changes."""
     
     def __init__(self, level: str):
-        self.new_level = getattr(logging, level.upper())
-        self.logger = logging.getLogger("tracker")
+        self.new_level = _LEVEL_MAP[level.upper()]
+        self.logger = _TRACKER_LOGGER
         self.old_level = None
     
     def __enter__(self):
@@ -289,11 +345,47 @@ def log_exception(logger: logging.Logger, exc: Exception, context: str = "") ->
         exc: Exception to log
         context: Additional context about where the error occurred
     """
-    import traceback
-    
-    error_msg = f"Exception in {context}: {exc}" if context else f"Exception: {exc}"
-    logger.error(error_msg)
-    logger.debug(f"Traceback:\n{traceback.format_exc()}")
+    if context:
+        logger.error("Exception in %s: %s", context, exc)
+    else:
+        logger.error("Exception: %s", exc)
+    # The handler formats the traceback only if the record is emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Traceback:", exc_info=exc)
+
+
+def _has_sensitive_keys(data: dict) -> bool:
+    """Check nested dictionaries for sensitive keys without recursing."""
+    stack = deque([data])
+    while stack:
+        for key, value in stack.pop().items():
+            if _SENSITIVE_RE.search(key):
+                return True
+            if isinstance(value, dict):
+                stack.append(value)
+    return False
+
+
+def _redact(data: dict) -> dict:
+    """Copy nested dictionaries with sensitive values masked, without recursing."""
+    redacted: dict = {}
+    # Copies by source id, so a dict reached twice is copied (and walked) once
+    copies = {id(data): redacted}
+    stack = deque([(data, redacted)])
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if _SENSITIVE_RE.search(key):
+                target[key] = "***REDACTED***"
+            elif isinstance(value, dict):
+                copy = copies.get(id(value))
+                if copy is None:
+                    copy = copies[id(value)] = {}
+                    stack.append((value, copy))
+                target[key] = copy
+            else:
+                target[key] = value
+    return redacted
 
 
 def sanitize_log_data(data: dict) -> dict:
@@ -304,21 +396,8 @@ def sanitize_log_data(data: dict) -> dict:
         data: Dictionary containing data to log
         
     Returns:
-        Sanitized dictionary
+        Sanitized dictionary (the input itself when nothing needs redacting)
     """
-    sensitive_keys = {
-        'password', 'api_key', 'secret', 'token', 
-        'cash_on_hand', 'bank_balance', 'debts_total',
-        'encryption_key', 'jwt_secret'
-    }
-    
-    sanitized = {}
-    for key, value in data.items():
-        if any(sensitive in key.lower() for sensitive in sensitive_keys):
-            sanitized[key] = "***REDACTED***"
-        elif isinstance(value, dict):
-            sanitized[key] = sanitize_log_data(value)
-        else:
-            sanitized[key] = value
-    
-    return sanitized
+    if not _has_sensitive_keys(data):
+        return data
+    return _redact(data)
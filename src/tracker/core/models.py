@@ -1,10 +1,12 @@
 """SQLAlchemy ORM models"""
 
-from datetime import date, datetime
-from decimal import Decimal
+import zlib
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from itertools import chain
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
     Column,
     Date,
@@ -14,17 +16,97 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
-    Numeric,
+    LargeBinary,
+    SmallInteger,
     String,
     Text,
     UniqueConstraint,
+    event,
+    insert,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, deferred, relationship
+from sqlalchemy.orm.attributes import flag_dirty
+from sqlalchemy.types import TypeDecorator
 
-from tracker.core.database import Base
+try:
+    import orjson
+
+    def _dumps(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+from tracker.core.database import Base, utcnow
 from tracker.core.encryption import encryption_service
 
 
+def _fixed_point(column: str, scale: int, places: str) -> hybrid_property:
+    """Expose an integer column storing ``value * scale`` as a Decimal
+
+    Works in Python (Decimal in/out) and in SQL expressions (filters, ordering).
+    """
+    quantum = Decimal(places)
+
+    def fget(self) -> Optional[Decimal]:
+        raw = getattr(self, column)
+        if raw is None:
+            return None
+        return (Decimal(raw) / scale).quantize(quantum)
+
+    def fset(self, value) -> None:
+        if value is None:
+            setattr(self, column, None)
+        else:
+            scaled = (Decimal(str(value)) * scale).to_integral_value(rounding=ROUND_HALF_UP)
+            setattr(self, column, int(scaled))
+
+    def expr(cls):
+        return getattr(cls, column) / scale
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
+class JSONText(TypeDecorator):
+    """JSON stored as TEXT, (de)serialized once by the ORM"""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return _dumps(value) if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return _loads(value) if value else None
+
+
+class EncryptedField:
+    """Attribute backed by the owning model's _get_encrypted/_set_encrypted
+
+    One descriptor class serves every encrypted attribute; the model decides
+    how the value is stored and cached.
+    """
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._get_encrypted(self.name)
+
+    def __set__(self, obj, value) -> None:
+        obj._set_encrypted(self.name, value)
+
+
 class User(Base):
     """User model"""
 
@@ -32,11 +114,14 @@ class User(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
-    email = Column(String(255), unique=True, nullable=True, index=True)
+    # 320 is the RFC 5321 maximum; case-insensitive on PostgreSQL
+    email = Column(
+        String(320).with_variant(CITEXT(), "postgresql"), unique=True, nullable=True, index=True
+    )
     password_hash = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     api_key_hash = Column(String(255), nullable=True, index=True)
-    settings = Column(Text, nullable=True)  # JSON string
+    settings = Column(JSONText, nullable=True)
 
     # Relationships
     entries = relationship("DailyEntry", back_populates="user", cascade="all, delete-orphan")
@@ -49,28 +134,38 @@ class DailyEntry(Base):
     __tablename__ = "daily_entries"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
 
     # Financial fields (some encrypted)
-    cash_on_hand_encrypted = Column(Text, nullable=True)  # Encrypted
-    bank_balance_encrypted = Column(Text, nullable=True)  # Encrypted
-    income_today = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
-    bills_due_today = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
-    debts_total_encrypted = Column(Text, nullable=True)  # Encrypted
-    hours_worked = Column(Numeric(4, 1), nullable=False, default=Decimal("0.0"))
-    side_income = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
-    food_spent = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
-    gas_spent = Column(Numeric(10, 2), nullable=False, default=Decimal("0.00"))
+    # Encrypted columns are deferred as one group; list queries that read them
+    # should use .options(undefer_group("encrypted")) to avoid a load per row
+    cash_on_hand_encrypted = deferred(Column(LargeBinary, nullable=True), group="encrypted")
+    bank_balance_encrypted = deferred(Column(LargeBinary, nullable=True), group="encrypted")
+    # Amounts are stored as integer cents (hours as tenths) and exposed as Decimals
+    income_today_cents = Column(BigInteger, nullable=False, default=0)
+    bills_due_today_cents = Column(BigInteger, nullable=False, default=0)
+    debts_total_encrypted = deferred(Column(LargeBinary, nullable=True), group="encrypted")
+    hours_worked_tenths = Column(Integer, nullable=False, default=0)
+    side_income_cents = Column(BigInteger, nullable=False, default=0)
+    food_spent_cents = Column(BigInteger, nullable=False, default=0)
+    gas_spent_cents = Column(BigInteger, nullable=False, default=0)
+
+    income_today = _fixed_point("income_today_cents", 100, "0.01")
+    bills_due_today = _fixed_point("bills_due_today_cents", 100, "0.01")
+    hours_worked = _fixed_point("hours_worked_tenths", 10, "0.1")
+    side_income = _fixed_point("side_income_cents", 100, "0.01")
+    food_spent = _fixed_point("food_spent_cents", 100, "0.01")
+    gas_spent = _fixed_point("gas_spent_cents", 100, "0.01")
 
     # Wellbeing fields
     notes = Column(Text, nullable=True)
-    stress_level = Column(Integer, nullable=False)
+    stress_level = Column(SmallInteger, nullable=False)
     priority = Column(String(255), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False, index=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
 
     # Relationships
     user = relationship("User", back_populates="entries")
@@ -79,56 +174,145 @@ class DailyEntry(Base):
 
     # Constraints
     __table_args__ = (
+        # Also serves every per-user date lookup and range scan, in either order
         UniqueConstraint("user_id", "date", name="uix_user_date"),
         CheckConstraint("stress_level >= 1 AND stress_level <= 10", name="check_stress_level"),
-        CheckConstraint("hours_worked >= 0 AND hours_worked <= 24", name="check_hours_worked"),
-        Index("ix_daily_entries_user_date", "user_id", "date"),
+        CheckConstraint("hours_worked_tenths >= 0 AND hours_worked_tenths <= 240", name="check_hours_worked"),
     )
 
-    @property
-    def cash_on_hand(self) -> Optional[Decimal]:
-        """Decrypt cash_on_hand"""
-        if self.cash_on_hand_encrypted:
-            return Decimal(encryption_service.decrypt(self.cash_on_hand_encrypted))
-        return None
-
-    @cash_on_hand.setter
-    def cash_on_hand(self, value: Optional[Decimal]):
-        """Encrypt cash_on_hand"""
-        if value is not None:
-            self.cash_on_hand_encrypted = encryption_service.encrypt(str(value))
-        else:
-            self.cash_on_hand_encrypted = None
-
-    @property
-    def bank_balance(self) -> Optional[Decimal]:
-        """Decrypt bank_balance"""
-        if self.bank_balance_encrypted:
-            return Decimal(encryption_service.decrypt(self.bank_balance_encrypted))
-        return None
-
-    @bank_balance.setter
-    def bank_balance(self, value: Optional[Decimal]):
-        """Encrypt bank_balance"""
-        if value is not None:
-            self.bank_balance_encrypted = encryption_service.encrypt(str(value))
-        else:
-            self.bank_balance_encrypted = None
-
-    @property
-    def debts_total(self) -> Optional[Decimal]:
-        """Decrypt debts_total"""
-        if self.debts_total_encrypted:
-            return Decimal(encryption_service.decrypt(self.debts_total_encrypted))
-        return None
-
-    @debts_total.setter
-    def debts_total(self, value: Optional[Decimal]):
-        """Encrypt debts_total"""
+    # Plaintext queued by set_encrypted_fields(), encrypted in one batch at flush
+    _ENCRYPTED_FIELDS = ("cash_on_hand", "bank_balance", "debts_total")
+
+    def _get_encrypted(self, name: str) -> Optional[Decimal]:
+        pending = self.__dict__.get("_pending_plaintext")
+        if pending and name in pending:
+            value = pending[name]
+            return Decimal(str(value)) if value is not None else None
+        encrypted = getattr(self, f"{name}_encrypted")
+        if not encrypted:
+            return None
+        # Decrypted values are cached per instance, keyed by the ciphertext
+        # they came from so a changed column is never served stale
+        cache = self.__dict__.setdefault("_decrypted_cache", {})
+        cached = cache.get(name)
+        if cached is not None and cached[0] == encrypted:
+            return cached[1]
+        value = Decimal(encryption_service.decrypt_bytes(encrypted))
+        cache[name] = (encrypted, value)
+        return value
+
+    def _set_encrypted(self, name: str, value: Optional[Decimal]) -> None:
+        pending = self.__dict__.get("_pending_plaintext")
+        if pending:
+            pending.pop(name, None)
         if value is not None:
-            self.debts_total_encrypted = encryption_service.encrypt(str(value))
+            encrypted = encryption_service.encrypt_bytes(str(value))
+            setattr(self, f"{name}_encrypted", encrypted)
+            self.__dict__.setdefault("_decrypted_cache", {})[name] = (encrypted, Decimal(str(value)))
         else:
-            self.debts_total_encrypted = None
+            setattr(self, f"{name}_encrypted", None)
+
+    def set_encrypted_fields(self, **values: Optional[Decimal]) -> None:
+        """
+        Queue new values for the encrypted fields
+
+        The values are readable immediately through the properties and are
+        encrypted together with every other queued field when the session
+        flushes.
+        """
+        unknown = set(values).difference(self._ENCRYPTED_FIELDS)
+        if unknown:
+            raise AttributeError(f"Not an encrypted field: {', '.join(sorted(unknown))}")
+        self.__dict__.setdefault("_pending_plaintext", {}).update(values)
+        flag_dirty(self)
+
+    @classmethod
+    def bulk_decrypt(cls, entries) -> None:
+        """
+        Decrypt the loaded ciphertexts of many entries in one batch
+
+        Primes each entry's decrypted cache so the properties no longer touch
+        the cipher. Deferred columns that were not loaded are skipped, as are
+        values that fail to decrypt; those raise only when their own property
+        is read.
+        """
+        targets = []
+        ciphertexts = []
+        for entry in entries:
+            state = entry.__dict__
+            cache = state.get("_decrypted_cache", {})
+            for name in cls._ENCRYPTED_FIELDS:
+                encrypted = state.get(f"{name}_encrypted")
+                if not encrypted:
+                    continue
+                cached = cache.get(name)
+                if cached is not None and cached[0] == encrypted:
+                    continue
+                targets.append((state, name, encrypted))
+                ciphertexts.append(encrypted)
+
+        if not ciphertexts:
+            return
+
+        try:
+            plaintexts = encryption_service.decrypt_many_bytes(ciphertexts)
+        except ValueError:
+            # A bad ciphertext must only fail reads of its own field, so
+            # retry one value at a time and leave the failures uncached
+            plaintexts = [cls._try_decrypt(encrypted) for encrypted in ciphertexts]
+
+        for (state, name, encrypted), plaintext in zip(targets, plaintexts):
+            if plaintext is None:
+                continue
+            try:
+                value = Decimal(plaintext)
+            except InvalidOperation:
+                continue
+            state.setdefault("_decrypted_cache", {})[name] = (encrypted, value)
+
+    @staticmethod
+    def _try_decrypt(encrypted: bytes) -> Optional[str]:
+        try:
+            return encryption_service.decrypt_bytes(encrypted)
+        except ValueError:
+            return None
+
+    # Decrypted views of the *_encrypted columns
+    cash_on_hand = EncryptedField()
+    bank_balance = EncryptedField()
+    debts_total = EncryptedField()
+
+
+@event.listens_for(DailyEntry, "load")
+@event.listens_for(DailyEntry, "refresh")
+def _decrypt_loaded_fields(target, context, attrs=None):
+    """Decrypt every loaded ciphertext of a row in one batch
+
+    Also runs when the deferred ``encrypted`` group is loaded later.
+    """
+    DailyEntry.bulk_decrypt((target,))
+
+
+@event.listens_for(Session, "before_flush")
+def _encrypt_pending_fields(session, flush_context, instances):
+    """Encrypt all plaintext queued via DailyEntry.set_encrypted_fields at once"""
+    targets = []
+    plaintexts = []
+    for obj in chain(session.new, session.dirty):
+        if not isinstance(obj, DailyEntry):
+            continue
+        pending = obj.__dict__.pop("_pending_plaintext", None)
+        if not pending:
+            continue
+        for name, value in pending.items():
+            targets.append((obj, name))
+            plaintexts.append(str(value) if value is not None else None)
+
+    if not targets:
+        return
+
+    for (obj, name), ciphertext in zip(targets, encryption_service.encrypt_many_bytes(plaintexts)):
+        setattr(obj, f"{name}_encrypted", ciphertext)
 
 
 class AIFeedback(Base):
@@ -152,8 +336,8 @@ class AIFeedback(Base):
     tokens_used = Column(Integer, nullable=True)
     generation_time = Column(Float, nullable=True)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False, index=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
 
     # Relationships
     entry = relationship("DailyEntry", back_populates="feedback")
@@ -179,7 +363,7 @@ class ConversationLog(Base):
         SQLEnum("system", "user", "assistant", name="message_role"), nullable=False
     )
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime, server_default=utcnow(), nullable=False)
 
     # Relationships
     feedback = relationship("AIFeedback", back_populates="conversation_logs")
@@ -197,137 +381,85 @@ class UserProfile(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Basic Info
     nickname = Column(String(100), nullable=True)
     preferred_tone = Column(String(50), nullable=True)  # casual, professional, encouraging, stoic
     context_depth = Column(String(20), default="basic", nullable=False)  # basic, personal, deep
     
-    # Work Setup (encrypted)
-    work_info_encrypted = Column(Text, nullable=True)  # JSON: job title, hourly/salary, pay schedule, hours, commute
-    
-    # Financial Overview (encrypted)
-    financial_info_encrypted = Column(Text, nullable=True)  # JSON: income sources, net pay, bills, debts
-    
-    # Goals (encrypted)
-    goals_encrypted = Column(Text, nullable=True)  # JSON: short-term and long-term goals
-    
-    # Lifestyle (encrypted)
-    lifestyle_encrypted = Column(Text, nullable=True)  # JSON: gym, gas usage, meals out, etc.
+    # Encrypted, zlib-compressed JSON object holding work_info (job title,
+    # hourly/salary, pay schedule, hours, commute), financial_info (income
+    # sources, net pay, bills, debts), goals (short/long-term), lifestyle
+    # (gym, gas usage, meals out, etc.) and detected_patterns
+    profile_blob_encrypted = Column(LargeBinary, nullable=True)
     
     # Emotional Context
-    stress_triggers = Column(Text, nullable=True)  # JSON array
-    calming_activities = Column(Text, nullable=True)  # JSON array
-    baseline_energy = Column(Integer, default=5, nullable=False)  # 1-10 scale
+    stress_triggers = Column(JSONText, nullable=True)  # list
+    calming_activities = Column(JSONText, nullable=True)  # list
+    baseline_energy = Column(SmallInteger, default=5, nullable=False)  # 1-10 scale
     baseline_stress = Column(Float, default=5.0, nullable=False)
     
-    # AI-Detected Patterns (not user-entered)
-    detected_patterns_encrypted = Column(Text, nullable=True)  # JSON: themes AI notices over time
-    
     # Preferences
     communication_style = Column(String(500), nullable=True)
-    reminder_preferences = Column(Text, nullable=True)  # JSON: when to get reminders
-    milestones = Column(Text, nullable=True)  # JSON: {date, event_type, description} for life events
+    reminder_preferences = Column(JSONText, nullable=True)  # when to get reminders
+    milestones = Column(JSONText, nullable=True)  # list of {date, event_type, description} for life events
     
     # Meta
-    total_entries = Column(Integer, default=0, nullable=False)
-    entry_streak = Column(Integer, default=0, nullable=False)
-    longest_streak = Column(Integer, default=0, nullable=False)
+    total_entries = Column(SmallInteger, default=0, nullable=False)
+    entry_streak = Column(SmallInteger, default=0, nullable=False)
+    longest_streak = Column(SmallInteger, default=0, nullable=False)
     last_entry_date = Column(Date, nullable=True)
     last_monthly_checkin = Column(Date, nullable=True)
     
     # Version for tracking profile evolution
-    profile_version = Column(Integer, default=1, nullable=False)
+    profile_version = Column(SmallInteger, default=1, nullable=False)
     
     # Relationship
     user = relationship("User")
     
-    @property
-    def work_info(self) -> Optional[dict]:
-        """Decrypt work_info"""
-        if self.work_info_encrypted:
-            import json
-            return json.loads(encryption_service.decrypt(self.work_info_encrypted))
-        return None
-    
-    @work_info.setter
-    def work_info(self, value: Optional[dict]):
-        """Encrypt work_info"""
-        if value is not None:
-            import json
-            self.work_info_encrypted = encryption_service.encrypt(json.dumps(value))
-        else:
-            self.work_info_encrypted = None
-    
-    @property
-    def financial_info(self) -> Optional[dict]:
-        """Decrypt financial_info"""
-        if self.financial_info_encrypted:
-            import json
-            return json.loads(encryption_service.decrypt(self.financial_info_encrypted))
-        return None
-    
-    @financial_info.setter
-    def financial_info(self, value: Optional[dict]):
-        """Encrypt financial_info"""
-        if value is not None:
-            import json
-            self.financial_info_encrypted = encryption_service.encrypt(json.dumps(value))
-        else:
-            self.financial_info_encrypted = None
-    
-    @property
-    def goals(self) -> Optional[dict]:
-        """Decrypt goals"""
-        if self.goals_encrypted:
-            import json
-            return json.loads(encryption_service.decrypt(self.goals_encrypted))
-        return None
-    
-    @goals.setter
-    def goals(self, value: Optional[dict]):
-        """Encrypt goals"""
-        if value is not None:
-            import json
-            self.goals_encrypted = encryption_service.encrypt(json.dumps(value))
-        else:
-            self.goals_encrypted = None
-    
-    @property
-    def lifestyle(self) -> Optional[dict]:
-        """Decrypt lifestyle"""
-        if self.lifestyle_encrypted:
-            import json
-            return json.loads(encryption_service.decrypt(self.lifestyle_encrypted))
-        return None
-    
-    @lifestyle.setter
-    def lifestyle(self, value: Optional[dict]):
-        """Encrypt lifestyle"""
+    def _profile_plaintext(self) -> Optional[bytes]:
+        encrypted = self.profile_blob_encrypted
+        if not encrypted:
+            return None
+        # Decompressed JSON is cached per instance, keyed by the ciphertext;
+        # each access still parses fresh objects so callers can mutate the
+        # result without touching the cache
+        cache = self.__dict__.setdefault("_decrypted_cache", {})
+        cached = cache.get("profile_blob")
+        if cached is None or cached[0] != encrypted:
+            plaintext = zlib.decompress(encryption_service.decrypt_raw_bytes(encrypted))
+            cached = cache["profile_blob"] = (encrypted, plaintext)
+        return cached[1]
+    
+    def _get_encrypted(self, name: str) -> Optional[dict]:
+        plaintext = self._profile_plaintext()
+        if plaintext is None:
+            return None
+        return _loads(plaintext).get(name)
+    
+    def _set_encrypted(self, name: str, value: Optional[dict]) -> None:
+        plaintext = self._profile_plaintext()
+        data = _loads(plaintext) if plaintext is not None else {}
         if value is not None:
-            import json
-            self.lifestyle_encrypted = encryption_service.encrypt(json.dumps(value))
+            data[name] = value
         else:
-            self.lifestyle_encrypted = None
-    
-    @property
-    def detected_patterns(self) -> Optional[dict]:
-        """Decrypt detected_patterns"""
-        if self.detected_patterns_encrypted:
-            import json
-            return json.loads(encryption_service.decrypt(self.detected_patterns_encrypted))
-        return None
-    
-    @detected_patterns.setter
-    def detected_patterns(self, value: Optional[dict]):
-        """Encrypt detected_patterns"""
-        if value is not None:
-            import json
-            self.detected_patterns_encrypted = encryption_service.encrypt(json.dumps(value))
-        else:
-            self.detected_patterns_encrypted = None
+            data.pop(name, None)
+        if not data:
+            self.profile_blob_encrypted = None
+            return
+        plaintext = _dumps(data).encode()
+        encrypted = encryption_service.encrypt_bytes(zlib.compress(plaintext))
+        self.profile_blob_encrypted = encrypted
+        self.__dict__.setdefault("_decrypted_cache", {})["profile_blob"] = (encrypted, plaintext)
+    
+    # Decrypted views of keys in profile_blob_encrypted
+    work_info = EncryptedField()
+    financial_info = EncryptedField()
+    goals = EncryptedField()
+    lifestyle = EncryptedField()
+    detected_patterns = EncryptedField()
 
 
 class Chat(Base):
@@ -341,8 +473,8 @@ class Chat(Base):
     
     # Chat metadata
     title = Column(String(500), nullable=False)  # Human-readable title
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False, index=True)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="chats")
@@ -365,7 +497,7 @@ class ChatMessage(Base):
     # Message content
     role = Column(SQLEnum("user", "assistant", "system", name="message_role"), nullable=False)
     content = Column(Text, nullable=False)  # Encrypted if sensitive
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # Relationship
     chat = relationship("Chat", back_populates="messages")
@@ -386,7 +518,7 @@ class CashFlowEvent(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    event_date = Column(Date, nullable=False, index=True)
+    event_date = Column(Date, nullable=False)
     
     # Event classification
     event_type = Column(
@@ -408,24 +540,38 @@ class CashFlowEvent(Base):
     memo = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationship
     user = relationship("User")
     
     # Indexes for efficient queries
     __table_args__ = (
-        Index("ix_cfe_user_date", "user_id", "event_date"),
+        # Covers per-user date-range sums by type without touching the table
+        Index(
+            "ix_cfe_user_date_type_amount",
+            "user_id", "event_date", "event_type", "amount_cents",
+        ),
         Index("ix_cfe_type_provider", "event_type", "provider"),
+        # Rows arrive roughly in date order, so PostgreSQL can use a tiny BRIN
+        # index for range scans; other dialects get a regular B-tree
+        Index(
+            "ix_cash_flow_events_event_date", "event_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
     
-    @property
-    def amount(self) -> Decimal:
-        """Get amount as Decimal (in dollars)"""
-        return Decimal(self.amount_cents) / 100
-    
-    @amount.setter
-    def amount(self, value: Decimal):
-        """Set amount from Decimal (in dollars)"""
-        self.amount_cents = int(value * 100)
+    amount = _fixed_point("amount_cents", 100, "0.01")
+    
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: list[dict]) -> None:
+        """
+        Insert many events from plain dicts in batched INSERT statements
+        
+        Skips per-object unit-of-work bookkeeping; timestamps come from the
+        server defaults. The caller commits.
+        """
+        if rows:
+            session.execute(insert(cls), rows)
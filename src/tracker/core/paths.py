@@ -1,291 +1,138 @@
 """Cross-platform path utilities for the Tracker application."""
 
+import functools
 import os
-import platform
+import secrets
+import stat
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Final, NamedTuple, Optional
 
+# sys.platform is a build-time constant; platform.system() would call uname()
+_SYSTEM: Final[str] = {"darwin": "Darwin", "win32": "Windows"}.get(sys.platform, "Linux")
 
-class TrackerPaths:
-    """Manages application paths across different platforms."""
-    
-    @staticmethod
-    def get_system() -> str:
-        """Get the current operating system."""
-        return platform.system()
-    
-    @staticmethod
-    def get_home_dir() -> Path:
-        """Get the user's home directory."""
-        return Path.home()
-    
-    @staticmethod
-    def get_config_dir() -> Path:
-        """
-        Get the configuration directory based on platform conventions.
-        
-        Returns:
-            - Windows: %APPDATA%/tracker
-            - macOS: ~/Library/Application Support/tracker
-            - Linux: ~/.config/tracker
-        """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use APPDATA on Windows
-            app_data = os.environ.get('APPDATA')
-            if app_data:
-                config_dir = Path(app_data) / "tracker"
-            else:
-                config_dir = Path.home() / "AppData" / "Roaming" / "tracker"
-        elif system == "Darwin":  # macOS
-            config_dir = Path.home() / "Library" / "Application Support" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_config = os.environ.get('XDG_CONFIG_HOME')
-            if xdg_config:
-                config_dir = Path(xdg_config) / "tracker"
-            else:
-                config_dir = Path.home() / ".config" / "tracker"
-        
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir
-    
-    @staticmethod
-    def get_data_dir() -> Path:
-        """
-        Get the data directory based on platform conventions.
-        
-        Returns:
-            - Windows: %LOCALAPPDATA%/tracker
-            - macOS: ~/Library/Application Support/tracker
-            - Linux: ~/.local/share/tracker
-        """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use LOCALAPPDATA on Windows
-            local_app_data = os.environ.get('LOCALAPPDATA')
-            if local_app_data:
-                data_dir = Path(local_app_data) / "tracker"
-            else:
-                data_dir = Path.home() / "AppData" / "Local" / "tracker"
-        elif system == "Darwin":  # macOS
-            data_dir = Path.home() / "Library" / "Application Support" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_data = os.environ.get('XDG_DATA_HOME')
-            if xdg_data:
-                data_dir = Path(xdg_data) / "tracker"
-            else:
-                data_dir = Path.home() / ".local" / "share" / "tracker"
-        
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir
-    
-    @staticmethod
-    def get_cache_dir() -> Path:
-        """
-        Get the cache directory based on platform conventions.
-        
-        Returns:
-            - Windows: %TEMP%/tracker
-            - macOS: ~/Library/Caches/tracker
-            - Linux: ~/.cache/tracker
-        """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use TEMP on Windows
-            temp_dir = os.environ.get('TEMP') or os.environ.get('TMP')
-            if temp_dir:
-                cache_dir = Path(temp_dir) / "tracker"
-            else:
-                cache_dir = Path.home() / "AppData" / "Local" / "Temp" / "tracker"
-        elif system == "Darwin":  # macOS
-            cache_dir = Path.home() / "Library" / "Caches" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_cache = os.environ.get('XDG_CACHE_HOME')
-            if xdg_cache:
-                cache_dir = Path(xdg_cache) / "tracker"
-            else:
-                cache_dir = Path.home() / ".cache" / "tracker"
-        
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
-    
-    @staticmethod
-    def get_log_dir() -> Path:
-        """
-        Get the log directory.
-        
-        Returns:
-            Platform-specific log directory within the data directory.
-        """
-        log_dir = TrackerPaths.get_data_dir() / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        return log_dir
-    
-    @staticmethod
-    def get_database_path(filename: str = "tracker.db") -> Path:
-        """
-        Get the database file path.
-        
-        Args:
-            filename: Database filename (default: tracker.db)
-            
-        Returns:
-            Full path to the database file.
-        """
-        return TrackerPaths.get_data_dir() / filename
-    
-    @staticmethod
-    def get_env_file_path() -> Path:
-        """
-        Get the .env file path.
-        
-        Checks in order:
-        1. Current working directory (for development)
-        2. Config directory (for production)
-        
-        Returns:
-            Path to the .env file.
-        """
-        # Check current directory first (for development)
-        local_env = Path.cwd() / ".env"
-        if local_env.exists():
-            return local_env
-        
-        # Otherwise use config directory
-        return TrackerPaths.get_config_dir() / ".env"
-    
-    @staticmethod
-    def get_export_dir() -> Path:
-        """
-        Get the default export directory.
-        
-        Returns:
-            User's Documents/Tracker directory.
-        """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Try to get Documents folder from registry or use default
-            documents = Path.home() / "Documents"
-        elif system == "Darwin":  # macOS
-            documents = Path.home() / "Documents"
-        else:  # Linux
-            # Check for XDG documents directory
-            xdg_documents = os.environ.get('XDG_DOCUMENTS_DIR')
-            if xdg_documents:
-                documents = Path(xdg_documents)
-            else:
-                documents = Path.home() / "Documents"
-        
-        export_dir = documents / "Tracker"
-        export_dir.mkdir(parents=True, exist_ok=True)
-        return export_dir
+
+def _resolve_paths() -> dict[str, Path]:
+    """
+    Resolve every application directory from platform conventions and env vars.
     
-    @staticmethod
-    def ensure_permissions(path: Path) -> None:
-        """
-        Ensure proper permissions for a file or directory.
-        
-        Args:
-            path: Path to set permissions for.
-        """
-        system = TrackerPaths.get_system()
-        
-        if system != "Windows":
-            # Set appropriate permissions on Unix-like systems
-            import stat
-            
-            if path.is_dir():
-                # Directory: rwx for owner, rx for group, nothing for others
-                path.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP)
-            else:
-                # File: rw for owner, r for group, nothing for others
-                path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP)
+    Runs once at import (and on TrackerPaths.invalidate_cache()) so the
+    getters only look their directory up.
+    """
+    # Joined as plain strings; only the final values are wrapped in Path
+    home = os.path.expanduser("~")
+    join = os.path.join
     
-    @staticmethod
-    def normalize_path(path: str) -> Path:
-        """
-        Normalize a path string to handle platform differences.
-        
-        Args:
-            path: Path string to normalize.
-            
-        Returns:
-            Normalized Path object.
-        """
-        # Expand user home directory
-        path = os.path.expanduser(path)
-        
-        # Expand environment variables
-        path = os.path.expandvars(path)
-        
-        # Convert to Path object and resolve
-        return Path(path).resolve()
+    if _SYSTEM == "Windows":
+        app_data = os.environ.get('APPDATA')
+        local_app_data = os.environ.get('LOCALAPPDATA')
+        temp_dir = os.environ.get('TEMP') or os.environ.get('TMP')
+        config_dir = join(app_data, "tracker") if app_data else join(home, "AppData", "Roaming", "tracker")
+        data_dir = join(local_app_data, "tracker") if local_app_data else join(home, "AppData", "Local", "tracker")
+        cache_dir = join(temp_dir, "tracker") if temp_dir else join(home, "AppData", "Local", "Temp", "tracker")
+        documents = join(home, "Documents")
+    elif _SYSTEM == "Darwin":  # macOS
+        config_dir = join(home, "Library", "Application Support", "tracker")
+        data_dir = join(home, "Library", "Application Support", "tracker")
+        cache_dir = join(home, "Library", "Caches", "tracker")
+        documents = join(home, "Documents")
+    else:  # Linux and other Unix-like systems (XDG Base Directory Specification)
+        xdg_config = os.environ.get('XDG_CONFIG_HOME')
+        xdg_data = os.environ.get('XDG_DATA_HOME')
+        xdg_cache = os.environ.get('XDG_CACHE_HOME')
+        xdg_documents = os.environ.get('XDG_DOCUMENTS_DIR')
+        config_dir = join(xdg_config, "tracker") if xdg_config else join(home, ".config", "tracker")
+        data_dir = join(xdg_data, "tracker") if xdg_data else join(home, ".local", "share", "tracker")
+        cache_dir = join(xdg_cache, "tracker") if xdg_cache else join(home, ".cache", "tracker")
+        documents = xdg_documents if xdg_documents else join(home, "Documents")
     
-    @staticmethod
-    def get_temp_file(prefix: str = "tracker_", suffix: str = ".tmp") -> Path:
-        """
-        Get a temporary file path.
-        
-        Args:
-            prefix: File prefix.
-            suffix: File suffix.
-            
-        Returns:
-            Path to a temporary file.
-        """
-        import tempfile
-        
-        temp_dir = TrackerPaths.get_cache_dir()
-        fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=temp_dir)
-        os.close(fd)  # Close the file descriptor
-        
-        return Path(temp_path)
+    return {
+        "config": Path(config_dir),
+        "data": Path(data_dir),
+        "cache": Path(cache_dir),
+        "log": Path(join(data_dir, "logs")),
+        "export": Path(join(documents, "Tracker")),
+    }
 
 
-# Convenience functions
-def get_config_dir() -> Path:
-    """Get the configuration directory."""
-    return TrackerPaths.get_config_dir()
-
+_PATH_TABLE: dict[str, Path] = _resolve_paths()
 
-def get_data_dir() -> Path:
-    """Get the data directory."""
-    return TrackerPaths.get_data_dir()
-
-
-def get_database_path(filename: str = "tracker.db") -> Path:
-    """Get the database file path."""
-    return TrackerPaths.get_database_path(filename)
+# Directories already created (or found) by this process
+_ensured_dirs: set[Path] = set()
 
 
-def get_log_dir() -> Path:
-    """Get the log directory."""
-    return TrackerPaths.get_log_dir()
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` (and parents) unless this process already did."""
+    if path not in _ensured_dirs:
+        # A single stat in the common case; makedirs only walks parents
+        # when the leaf is actually missing
+        raw = os.fspath(path)
+        if not os.path.isdir(raw):
+            os.makedirs(raw, exist_ok=True)
+        _ensured_dirs.add(path)
 
 
-def get_export_dir() -> Path:
-    """Get the export directory."""
-    return TrackerPaths.get_export_dir()
-import os
-import platform
-from pathlib import Path
-from typing import Optional
+class AppPaths(NamedTuple):
+    """Every application directory, as created by TrackerPaths.bootstrap()."""
+    
+    config: Path
+    data: Path
+    cache: Path
+    log: Path
+    export: Path
 
 
 class TrackerPaths:
-    """Manages application paths across different platforms."""
+    """
+    Manages application paths across different platforms.
+    
+    Directory getters are memoized: the platform/env lookup and the mkdir
+    happen on the first call only.
+    """
     
     @staticmethod
     def get_system() -> str:
         """Get the current operating system."""
-        return platform.system()
+        return _SYSTEM
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Re-read the environment and forget the memoized directories (e.g. in tests)."""
+        global _PATH_TABLE
+        _PATH_TABLE = _resolve_paths()
+        # The directories may have been removed since they were created
+        _ensured_dirs.clear()
+        for getter in (
+            cls.get_config_dir,
+            cls.get_data_dir,
+            cls.get_cache_dir,
+            cls.get_log_dir,
+            cls.get_export_dir,
+        ):
+            getter.cache_clear()
+    
+    @classmethod
+    def bootstrap(cls) -> AppPaths:
+        """
+        Create every application directory in one pass at startup.
+        
+        Later getter calls are then pure lookups.
+        
+        Returns:
+            The resolved application directories.
+        """
+        return AppPaths(
+            config=cls.get_config_dir(),
+            data=cls.get_data_dir(),
+            cache=cls.get_cache_dir(),
+            log=cls.get_log_dir(),
+            export=cls.get_export_dir(),
+        )
+    
+    @classmethod
+    def invalidate_env_cache(cls) -> None:
+        """Forget the memoized .env location (e.g. after a chdir in tests)."""
+        cls.get_env_file_path.cache_clear()
     
     @staticmethod
     def get_home_dir() -> Path:
@@ -293,6 +140,7 @@ class TrackerPaths:
         return Path.home()
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_config_dir() -> Path:
         """
         Get the configuration directory based on platform conventions.
@@ -302,29 +150,12 @@ class TrackerPaths:
             - macOS: ~/Library/Application Support/tracker
             - Linux: ~/.config/tracker
         """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use APPDATA on Windows
-            app_data = os.environ.get('APPDATA')
-            if app_data:
-                config_dir = Path(app_data) / "tracker"
-            else:
-                config_dir = Path.home() / "AppData" / "Roaming" / "tracker"
-        elif system == "Darwin":  # macOS
-            config_dir = Path.home() / "Library" / "Application Support" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_config = os.environ.get('XDG_CONFIG_HOME')
-            if xdg_config:
-                config_dir = Path(xdg_config) / "tracker"
-            else:
-                config_dir = Path.home() / ".config" / "tracker"
-        
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = _PATH_TABLE["config"]
+        _ensure_dir(config_dir)
         return config_dir
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_data_dir() -> Path:
         """
         Get the data directory based on platform conventions.
@@ -334,29 +165,12 @@ class TrackerPaths:
             - macOS: ~/Library/Application Support/tracker
             - Linux: ~/.local/share/tracker
         """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use LOCALAPPDATA on Windows
-            local_app_data = os.environ.get('LOCALAPPDATA')
-            if local_app_data:
-                data_dir = Path(local_app_data) / "tracker"
-            else:
-                data_dir = Path.home() / "AppData" / "Local" / "tracker"
-        elif system == "Darwin":  # macOS
-            data_dir = Path.home() / "Library" / "Application Support" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_data = os.environ.get('XDG_DATA_HOME')
-            if xdg_data:
-                data_dir = Path(xdg_data) / "tracker"
-            else:
-                data_dir = Path.home() / ".local" / "share" / "tracker"
-        
-        data_dir.mkdir(parents=True, exist_ok=True)
+        data_dir = _PATH_TABLE["data"]
+        _ensure_dir(data_dir)
         return data_dir
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_cache_dir() -> Path:
         """
         Get the cache directory based on platform conventions.
@@ -366,29 +180,12 @@ class TrackerPaths:
             - macOS: ~/Library/Caches/tracker
             - Linux: ~/.cache/tracker
         """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Use TEMP on Windows
-            temp_dir = os.environ.get('TEMP') or os.environ.get('TMP')
-            if temp_dir:
-                cache_dir = Path(temp_dir) / "tracker"
-            else:
-                cache_dir = Path.home() / "AppData" / "Local" / "Temp" / "tracker"
-        elif system == "Darwin":  # macOS
-            cache_dir = Path.home() / "Library" / "Caches" / "tracker"
-        else:  # Linux and other Unix-like systems
-            # Follow XDG Base Directory Specification
-            xdg_cache = os.environ.get('XDG_CACHE_HOME')
-            if xdg_cache:
-                cache_dir = Path(xdg_cache) / "tracker"
-            else:
-                cache_dir = Path.home() / ".cache" / "tracker"
-        
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_dir = _PATH_TABLE["cache"]
+        _ensure_dir(cache_dir)
         return cache_dir
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_log_dir() -> Path:
         """
         Get the log directory.
@@ -396,8 +193,8 @@ class TrackerPaths:
         Returns:
             Platform-specific log directory within the data directory.
         """
-        log_dir = TrackerPaths.get_data_dir() / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        log_dir = _PATH_TABLE["log"]
+        _ensure_dir(log_dir)
         return log_dir
     
     @staticmethod
@@ -414,6 +211,7 @@ class TrackerPaths:
         return TrackerPaths.get_data_dir() / filename
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_env_file_path() -> Path:
         """
         Get the .env file path.
@@ -422,6 +220,8 @@ class TrackerPaths:
         1. Current working directory (for development)
         2. Config directory (for production)
         
+        The result is memoized; call invalidate_env_cache() after a chdir.
+        
         Returns:
             Path to the .env file.
         """
@@ -434,6 +234,7 @@ class TrackerPaths:
         return TrackerPaths.get_config_dir() / ".env"
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_export_dir() -> Path:
         """
         Get the default export directory.
@@ -441,23 +242,8 @@ class TrackerPaths:
         Returns:
             User's Documents/Tracker directory.
         """
-        system = TrackerPaths.get_system()
-        
-        if system == "Windows":
-            # Try to get Documents folder from registry or use default
-            documents = Path.home() / "Documents"
-        elif system == "Darwin":  # macOS
-            documents = Path.home() / "Documents"
-        else:  # Linux
-            # Check for XDG documents directory
-            xdg_documents = os.environ.get('XDG_DOCUMENTS_DIR')
-            if xdg_documents:
-                documents = Path(xdg_documents)
-            else:
-                documents = Path.home() / "Documents"
-        
-        export_dir = documents / "Tracker"
-        export_dir.mkdir(parents=True, exist_ok=True)
+        export_dir = _PATH_TABLE["export"]
+        _ensure_dir(export_dir)
         return export_dir
     
     @staticmethod
@@ -468,12 +254,10 @@ class TrackerPaths:
         Args:
             path: Path to set permissions for.
         """
-        system = TrackerPaths.get_system()
+        system = _SYSTEM
         
         if system != "Windows":
             # Set appropriate permissions on Unix-like systems
-            import stat
-            
             if path.is_dir():
                 # Directory: rwx for owner, rx for group, nothing for others
                 path.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP)
@@ -482,29 +266,33 @@ class TrackerPaths:
                 path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP)
     
     @staticmethod
-    def normalize_path(path: str) -> Path:
+    def normalize_path(path: str, *, resolve: bool = True) -> Path:
         """
         Normalize a path string to handle platform differences.
         
         Args:
             path: Path string to normalize.
+            resolve: Resolve symlinks against the filesystem. When False the
+                path is only made absolute and normalized lexically, without
+                any syscalls.
             
         Returns:
             Normalized Path object.
         """
-        # Expand user home directory
-        path = os.path.expanduser(path)
-        
-        # Expand environment variables
-        path = os.path.expandvars(path)
+        # Expand user home directory, then environment variables
+        path = os.path.expandvars(os.path.expanduser(path))
         
-        # Convert to Path object and resolve
-        return Path(path).resolve()
+        if resolve:
+            return Path(path).resolve()
+        return Path(os.path.normpath(os.path.abspath(path)))
     
     @staticmethod
     def get_temp_file(prefix: str = "tracker_", suffix: str = ".tmp") -> Path:
         """
-        Get a temporary file path.
+        Get a unique temporary file path in the cache directory.
+        
+        The file is not created; open it with ``O_CREAT | O_EXCL`` (e.g.
+        ``open(path, "x")``) when writing.
         
         Args:
             prefix: File prefix.
@@ -513,13 +301,7 @@ class TrackerPaths:
         Returns:
             Path to a temporary file.
         """
-        import tempfile
-        
-        temp_dir = TrackerPaths.get_cache_dir()
-        fd, temp_path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=temp_dir)
-        os.close(fd)  # Close the file descriptor
-        
-        return Path(temp_path)
+        return TrackerPaths.get_cache_dir() / f"{prefix}{secrets.token_hex(8)}{suffix}"
 
 
 # Convenience functions
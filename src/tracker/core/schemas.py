@@ -1,25 +1,35 @@
 """Pydantic schemas for validation"""
 
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Shared defaults; Decimal is immutable so one instance is safe to reuse
+_ZERO_2P = Decimal("0.00")
+_ZERO_1P = Decimal("0.0")
 
 
 class EntryCreate(BaseModel):
-    """Schema for creating an entry"""
+    """Schema for creating an entry
+
+    Pre-validated rows (e.g. bulk imports) can skip validation entirely
+    with ``EntryCreate.model_construct(**row)``.
+    """
+
+    model_config = ConfigDict(extra="forbid")
 
     date: date
     cash_on_hand: Optional[Decimal] = None
     bank_balance: Optional[Decimal] = None
-    income_today: Decimal = Field(default=Decimal("0.00"), ge=0)
-    bills_due_today: Decimal = Field(default=Decimal("0.00"), ge=0)
+    income_today: Decimal = Field(default=_ZERO_2P, ge=0)
+    bills_due_today: Decimal = Field(default=_ZERO_2P, ge=0)
     debts_total: Optional[Decimal] = None
-    hours_worked: Decimal = Field(default=Decimal("0.0"), ge=0, le=24)
-    side_income: Decimal = Field(default=Decimal("0.00"), ge=0)
-    food_spent: Decimal = Field(default=Decimal("0.00"), ge=0)
-    gas_spent: Decimal = Field(default=Decimal("0.00"), ge=0)
+    hours_worked: Decimal = Field(default=_ZERO_1P, ge=0, le=24)
+    side_income: Decimal = Field(default=_ZERO_2P, ge=0)
+    food_spent: Decimal = Field(default=_ZERO_2P, ge=0)
+    gas_spent: Decimal = Field(default=_ZERO_2P, ge=0)
     notes: Optional[str] = None
     stress_level: int = Field(..., ge=1, le=10)
     priority: Optional[str] = Field(None, max_length=255)
@@ -28,8 +38,7 @@ class EntryCreate(BaseModel):
     @classmethod
     def validate_date(cls, v: date) -> date:
         """Validate date is not in future"""
-        from datetime import date as dt_date
-        if v > dt_date.today():
+        if v > date.today():
             raise ValueError("Date cannot be in the future")
         return v
 
@@ -37,6 +46,8 @@ class EntryCreate(BaseModel):
 class EntryUpdate(BaseModel):
     """Schema for updating an entry (all fields optional for partial updates)"""
 
+    model_config = ConfigDict(extra="forbid")
+
     cash_on_hand: Optional[Decimal] = None
     bank_balance: Optional[Decimal] = None
     income_today: Optional[Decimal] = Field(None, ge=0)
@@ -50,14 +61,12 @@ class EntryUpdate(BaseModel):
     stress_level: Optional[int] = Field(None, ge=1, le=10)
     priority: Optional[str] = Field(None, max_length=255)
 
-    class Config:
-        # Allow arbitrary types for Decimal handling
-        arbitrary_types_allowed = True
-
 
 class EntryResponse(BaseModel):
     """Schema for entry response"""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, revalidate_instances="never")
+
     id: int
     date: date
     cash_on_hand: Optional[Decimal]
@@ -72,16 +81,15 @@ class EntryResponse(BaseModel):
     notes: Optional[str]
     stress_level: int
     priority: Optional[str]
-    created_at: str
-    updated_at: str
-
-    class Config:
-        from_attributes = True
+    created_at: datetime
+    updated_at: datetime
 
 
 class FeedbackResponse(BaseModel):
     """Schema for feedback response"""
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, revalidate_instances="never")
+
     id: int
     entry_id: int
     content: str
@@ -90,7 +98,4 @@ class FeedbackResponse(BaseModel):
     model: Optional[str]
     tokens_used: Optional[int]
     generation_time: Optional[float]
-    created_at: str
-
-    class Config:
-        from_attributes = True
+    created_at: datetime
@@ -1,5 +1,6 @@
 """Input validation utilities for the Tracker application."""
 
+import functools
 import re
 from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
@@ -7,6 +8,85 @@ from pathlib import Path
 from typing import Any, Optional, Union, List, Dict
 from tracker.core.exceptions import ValidationError
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]{3,50}$')
+_WS_RE = re.compile(r'[ \t]+')
+
+# Thousands separators and whitespace, removed from numeric strings in one pass
+_NUMERIC_STRIP_TABLE = str.maketrans('', '', ', \t\n\r')
+
+# Accepted date layouts: YYYY-MM-DD / YYYY/MM/DD, and MM-DD-YYYY / DD-MM-YYYY
+# (either separator, used consistently)
+_DATE_YEAR_FIRST_RE = re.compile(r'^(\d{4})([-/])(\d{1,2})\2(\d{1,2})$')
+_DATE_YEAR_LAST_RE = re.compile(r'^(\d{1,2})([-/])(\d{1,2})\2(\d{4})$')
+
+# Control characters except tab, newline and carriage return, mapped for deletion
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> date:
+    """
+    Parse a date string in one of the accepted layouts.
+    
+    Day-first strings are only tried when the month-first reading is not a
+    valid date, matching the old strptime format order. Results are cached
+    since imports repeat the same strings; range checks stay with the caller.
+    """
+    text = value.strip()
+    
+    match = _DATE_YEAR_FIRST_RE.match(text)
+    if match:
+        candidates = ((match[1], match[3], match[4]),)
+    else:
+        match = _DATE_YEAR_LAST_RE.match(text)
+        if not match:
+            raise ValidationError(f"Invalid date format: {value}")
+        candidates = ((match[4], match[1], match[3]), (match[4], match[3], match[1]))
+    
+    for year, month, day in candidates:
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            continue
+    
+    raise ValidationError(f"Invalid date format: {value}")
+
+
+@functools.lru_cache(maxsize=256)
+def _get_pattern(pattern: str) -> re.Pattern:
+    """Compile a caller-supplied pattern once and reuse it."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=128)
+def _allowed_set(allowed_chars: str) -> frozenset:
+    """Build the membership set for an ``allowed_chars`` string once."""
+    return frozenset(allowed_chars)
+
+
+def _validate_currency(value: Any) -> Decimal:
+    return Validators.validate_decimal(
+        value,
+        allow_negative=True,  # Allow negative for debts
+        max_decimal_places=2
+    )
+
+
+def _validate_hours(value: Any) -> Decimal:
+    return Validators.validate_decimal(
+        value,
+        min_value=Decimal("0"),
+        max_value=Decimal("24"),
+        max_decimal_places=1
+    )
+
+
+# Memoized variants for string input, which repeats heavily in imports;
+# failures raise and are never cached
+_validate_currency_cached = functools.lru_cache(maxsize=2048)(_validate_currency)
+_validate_hours_cached = functools.lru_cache(maxsize=2048)(_validate_hours)
+
 
 class Validators:
     """Collection of validation methods for various input types."""
@@ -38,10 +118,18 @@ class Validators:
             ValidationError: If validation fails
         """
         try:
-            if isinstance(value, str):
-                value = value.strip().replace(',', '')
-            
-            decimal_value = Decimal(str(value))
+            # Skip the str() round-trip for values that are already exact
+            value_type = type(value)
+            if value_type is Decimal:
+                decimal_value = value
+            elif value_type is int:
+                decimal_value = Decimal(value)
+            else:
+                if isinstance(value, str):
+                    value = value.translate(_NUMERIC_STRIP_TABLE)
+                
+                # str() keeps floats at their shortest repr rather than binary expansion
+                decimal_value = Decimal(str(value))
             
             # Check for NaN or Infinity
             if not decimal_value.is_finite():
@@ -62,7 +150,7 @@ class Validators:
             if max_value is not None and decimal_value > max_value:
                 raise ValidationError(f"Value must be at most {max_value}")
             
-            # Check decimal places
+            # Check decimal places (needs no context precision, unlike quantize)
             if decimal_value.as_tuple().exponent < -max_decimal_places:
                 raise ValidationError(f"Value can have at most {max_decimal_places} decimal places")
             
@@ -91,26 +179,36 @@ class Validators:
         Raises:
             ValidationError: If validation fails
         """
-        try:
-            int_value = int(value)
-            
-            if min_value is not None and int_value < min_value:
-                raise ValidationError(f"Value must be at least {min_value}")
-            
-            if max_value is not None and int_value > max_value:
-                raise ValidationError(f"Value must be at most {max_value}")
-            
-            return int_value
-            
-        except (ValueError, TypeError):
-            raise ValidationError(f"Invalid integer value: {value}")
+        if type(value) is int:
+            int_value = value
+        elif isinstance(value, str):
+            # Pre-check digits so bad input does not go through int()'s exception
+            text = value.strip()
+            digits = text[1:] if text[:1] in ('-', '+') else text
+            if not digits.isdecimal():
+                raise ValidationError(f"Invalid integer value: {value}")
+            int_value = int(text)
+        else:
+            try:
+                int_value = int(value)
+            except (ValueError, TypeError):
+                raise ValidationError(f"Invalid integer value: {value}")
+        
+        if min_value is not None and int_value < min_value:
+            raise ValidationError(f"Value must be at least {min_value}")
+        
+        if max_value is not None and int_value > max_value:
+            raise ValidationError(f"Value must be at most {max_value}")
+        
+        return int_value
     
     @staticmethod
     def validate_date(
         value: Any,
         allow_future: bool = False,
         min_date: Optional[date] = None,
-        max_date: Optional[date] = None
+        max_date: Optional[date] = None,
+        today: Optional[date] = None
     ) -> date:
         """
         Validate and convert a value to date.
@@ -120,6 +218,8 @@ class Validators:
             allow_future: Whether future dates are allowed
             min_date: Minimum allowed date
             max_date: Maximum allowed date
+            today: Reference date for the future check; bulk callers can
+                pass it once instead of reading the clock per value
             
         Returns:
             Validated date
@@ -132,31 +232,12 @@ class Validators:
         elif isinstance(value, date):
             date_value = value
         elif isinstance(value, str):
-            # Try multiple date formats
-            formats = [
-                "%Y-%m-%d",
-                "%Y/%m/%d",
-                "%m/%d/%Y",
-                "%m-%d-%Y",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-            ]
-            
-            date_value = None
-            for fmt in formats:
-                try:
-                    date_value = datetime.strptime(value.strip(), fmt).date()
-                    break
-                except ValueError:
-                    continue
-            
-            if date_value is None:
-                raise ValidationError(f"Invalid date format: {value}")
+            date_value = _parse_date_str(value)
         else:
             raise ValidationError(f"Invalid date type: {type(value)}")
         
         # Check future constraint
-        if not allow_future and date_value > date.today():
+        if not allow_future and date_value > (today or date.today()):
             raise ValidationError("Date cannot be in the future")
         
         # Check min/max constraints
@@ -184,7 +265,7 @@ class Validators:
             value: Value to validate
             min_length: Minimum string length
             max_length: Maximum string length
-            pattern: Regex pattern the string must match
+            pattern: Regex pattern the whole string must match
             allowed_chars: String of allowed characters
             strip: Whether to strip whitespace
             
@@ -210,14 +291,16 @@ class Validators:
             raise ValidationError(f"String must be at most {max_length} characters")
         
         # Check pattern
-        if pattern and not re.match(pattern, str_value):
+        if pattern and not _get_pattern(pattern).fullmatch(str_value):
             raise ValidationError(f"String does not match required pattern")
         
         # Check allowed characters
         if allowed_chars:
-            for char in str_value:
-                if char not in allowed_chars:
-                    raise ValidationError(f"Character '{char}' is not allowed")
+            disallowed = set(str_value).difference(_allowed_set(allowed_chars))
+            if disallowed:
+                # Report the first offending character in input order
+                char = next(ch for ch in str_value if ch in disallowed)
+                raise ValidationError(f"Character '{char}' is not allowed")
         
         return str_value
     
@@ -235,11 +318,10 @@ class Validators:
         Raises:
             ValidationError: If email is invalid
         """
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
         email = value.strip().lower()
         
-        if not re.match(email_pattern, email):
+        # Cheap substring checks reject obvious non-addresses before the regex
+        if '@' not in email or '.' not in email or not _EMAIL_RE.match(email):
             raise ValidationError(f"Invalid email address: {value}")
         
         return email
@@ -260,16 +342,17 @@ class Validators:
         """
         username = value.strip()
         
+        # One scan checks both length and characters for valid input
+        if _USERNAME_RE.match(username):
+            return username
+        
         if len(username) < 3:
             raise ValidationError("Username must be at least 3 characters")
         
         if len(username) > 50:
             raise ValidationError("Username must be at most 50 characters")
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', username):
-            raise ValidationError("Username can only contain letters, numbers, hyphens, and underscores")
-        
-        return username
+        raise ValidationError("Username can only contain letters, numbers, hyphens, and underscores")
     
     @staticmethod
     def validate_path(
@@ -296,18 +379,25 @@ class Validators:
             ValidationError: If path is invalid
         """
         try:
-            path = Path(value).resolve()
+            path = Path(value)
+            
+            # Only touch the filesystem when a check actually needs it
+            if not (must_exist or must_be_file or must_be_dir or create_parents):
+                return path
+            
+            path = path.resolve()
+            exists = path.exists()
             
-            if must_exist and not path.exists():
+            if must_exist and not exists:
                 raise ValidationError(f"Path does not exist: {path}")
             
-            if must_be_file and path.exists() and not path.is_file():
+            if must_be_file and exists and not path.is_file():
                 raise ValidationError(f"Path is not a file: {path}")
             
-            if must_be_dir and path.exists() and not path.is_dir():
+            if must_be_dir and exists and not path.is_dir():
                 raise ValidationError(f"Path is not a directory: {path}")
             
-            if create_parents and not path.exists():
+            if create_parents and not exists:
                 path.parent.mkdir(parents=True, exist_ok=True)
             
             return path
@@ -345,12 +435,9 @@ class Validators:
         Raises:
             ValidationError: If hours are invalid
         """
-        return Validators.validate_decimal(
-            value,
-            min_value=Decimal("0"),
-            max_value=Decimal("24"),
-            max_decimal_places=1
-        )
+        if isinstance(value, str):
+            return _validate_hours_cached(value)
+        return _validate_hours(value)
     
     @staticmethod
     def validate_currency(value: Any) -> Decimal:
@@ -366,11 +453,9 @@ class Validators:
         Raises:
             ValidationError: If amount is invalid
         """
-        return Validators.validate_decimal(
-            value,
-            allow_negative=True,  # Allow negative for debts
-            max_decimal_places=2
-        )
+        if isinstance(value, str):
+            return _validate_currency_cached(value)
+        return _validate_currency(value)
     
     @staticmethod
     def sanitize_text(text: str, max_length: int = 5000) -> str:
@@ -387,12 +472,19 @@ class Validators:
         if not text:
             return ""
         
+        # Fast path: printable text (no control chars, tabs or newlines) with
+        # no double spaces is already clean
+        if len(text) <= max_length and '  ' not in text and text.isprintable():
+            return text.strip()
+        
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        sanitized = text.translate(_CTRL_TABLE)
         
         # Normalize whitespace
-        sanitized = re.sub(r'[ \t]+', ' ', sanitized)
-        sanitized = re.sub(r'\n{3,}', '\n\n', sanitized)
+        sanitized = _WS_RE.sub(' ', sanitized)
+        # Plain substring replace; a single membership check in the common case
+        while '\n\n\n' in sanitized:
+            sanitized = sanitized.replace('\n\n\n', '\n\n')
         
         # Truncate if too long
         if len(sanitized) > max_length:
@@ -401,13 +493,28 @@ class Validators:
         return sanitized.strip()
 
 
+_CURRENCY_FIELDS = (
+    'cash_on_hand', 'bank_balance', 'income_today',
+    'bills_due_today', 'debts_total', 'side_income',
+    'food_spent', 'gas_spent'
+)
+
+# Numeric entry fields skipped when missing or None, paired with their
+# validator; resolved once here instead of on every call
+_NUMERIC_ENTRY_FIELDS = tuple(
+    (field, Validators.validate_currency) for field in _CURRENCY_FIELDS
+) + (('hours_worked', Validators.validate_hours_worked),)
+
+
 # Convenience functions
-def validate_entry_data(data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_entry_data(data: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
     """
     Validate all fields for a daily entry.
     
     Args:
         data: Entry data dictionary
+        today: Reference date for the future-date check (defaults to today);
+            pass it once when validating many entries
         
     Returns:
         Validated data dictionary
@@ -419,22 +526,14 @@ def validate_entry_data(data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Date
     if 'date' in data:
-        validated['date'] = Validators.validate_date(data['date'])
-    
-    # Financial fields
-    currency_fields = [
-        'cash_on_hand', 'bank_balance', 'income_today',
-        'bills_due_today', 'debts_total', 'side_income',
-        'food_spent', 'gas_spent'
-    ]
-    
-    for field in currency_fields:
-        if field in data and data[field] is not None:
-            validated[field] = Validators.validate_currency(data[field])
+        validated['date'] = Validators.validate_date(data['date'], today=today)
     
-    # Hours worked
-    if 'hours_worked' in data and data['hours_worked'] is not None:
-        validated['hours_worked'] = Validators.validate_hours_worked(data['hours_worked'])
+    # Financial fields and hours worked
+    get = data.get
+    for field, validator in _NUMERIC_ENTRY_FIELDS:
+        value = get(field)
+        if value is not None:
+            validated[field] = validator(value)
     
     # Stress level
     if 'stress_level' in data:
@@ -448,451 +547,31 @@ def validate_entry_data(data: Dict[str, Any]) -> Dict[str, Any]:
         validated['notes'] = Validators.sanitize_text(data['notes'], max_length=5000)
     
     return validated
-import re
-from datetime import date, datetime, timedelta
-from decimal import Decimal, InvalidOperation
-from pathlib import Path
-from typing import Any, Optional, Union, List, Dict
-from tracker.core.exceptions import ValidationError
-
-
-class Validators:
-    """Collection of validation methods for various input types."""
-    
-    @staticmethod
-    def validate_decimal(
-        value: Any,
-        min_value: Optional[Decimal] = None,
-        max_value: Optional[Decimal] = None,
-        allow_negative: bool = False,
-        allow_zero: bool = True,
-        max_decimal_places: int = 2
-    ) -> Decimal:
-        """
-        Validate and convert a value to Decimal.
-        
-        Args:
-            value: Value to validate
-            min_value: Minimum allowed value
-            max_value: Maximum allowed value
-            allow_negative: Whether negative values are allowed
-            allow_zero: Whether zero is allowed
-            max_decimal_places: Maximum number of decimal places
-            
-        Returns:
-            Validated Decimal value
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        try:
-            if isinstance(value, str):
-                value = value.strip().replace(',', '')
-            
-            decimal_value = Decimal(str(value))
-            
-            # Check for NaN or Infinity
-            if not decimal_value.is_finite():
-                raise ValidationError("Value must be a finite number")
-            
-            # Check negative constraint
-            if not allow_negative and decimal_value < 0:
-                raise ValidationError("Value cannot be negative")
-            
-            # Check zero constraint
-            if not allow_zero and decimal_value == 0:
-                raise ValidationError("Value cannot be zero")
-            
-            # Check min/max constraints
-            if min_value is not None and decimal_value < min_value:
-                raise ValidationError(f"Value must be at least {min_value}")
-            
-            if max_value is not None and decimal_value > max_value:
-                raise ValidationError(f"Value must be at most {max_value}")
-            
-            # Check decimal places
-            if decimal_value.as_tuple().exponent < -max_decimal_places:
-                raise ValidationError(f"Value can have at most {max_decimal_places} decimal places")
-            
-            return decimal_value
-            
-        except (InvalidOperation, ValueError) as e:
-            raise ValidationError(f"Invalid decimal value: {value}")
-    
-    @staticmethod
-    def validate_integer(
-        value: Any,
-        min_value: Optional[int] = None,
-        max_value: Optional[int] = None
-    ) -> int:
-        """
-        Validate and convert a value to integer.
-        
-        Args:
-            value: Value to validate
-            min_value: Minimum allowed value
-            max_value: Maximum allowed value
-            
-        Returns:
-            Validated integer value
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        try:
-            int_value = int(value)
-            
-            if min_value is not None and int_value < min_value:
-                raise ValidationError(f"Value must be at least {min_value}")
-            
-            if max_value is not None and int_value > max_value:
-                raise ValidationError(f"Value must be at most {max_value}")
-            
-            return int_value
-            
-        except (ValueError, TypeError):
-            raise ValidationError(f"Invalid integer value: {value}")
-    
-    @staticmethod
-    def validate_date(
-        value: Any,
-        allow_future: bool = False,
-        min_date: Optional[date] = None,
-        max_date: Optional[date] = None
-    ) -> date:
-        """
-        Validate and convert a value to date.
-        
-        Args:
-            value: Value to validate (string, date, or datetime)
-            allow_future: Whether future dates are allowed
-            min_date: Minimum allowed date
-            max_date: Maximum allowed date
-            
-        Returns:
-            Validated date
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if isinstance(value, datetime):
-            date_value = value.date()
-        elif isinstance(value, date):
-            date_value = value
-        elif isinstance(value, str):
-            # Try multiple date formats
-            formats = [
-                "%Y-%m-%d",
-                "%Y/%m/%d",
-                "%m/%d/%Y",
-                "%m-%d-%Y",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-            ]
-            
-            date_value = None
-            for fmt in formats:
-                try:
-                    date_value = datetime.strptime(value.strip(), fmt).date()
-                    break
-                except ValueError:
-                    continue
-            
-            if date_value is None:
-                raise ValidationError(f"Invalid date format: {value}")
-        else:
-            raise ValidationError(f"Invalid date type: {type(value)}")
-        
-        # Check future constraint
-        if not allow_future and date_value > date.today():
-            raise ValidationError("Date cannot be in the future")
-        
-        # Check min/max constraints
-        if min_date and date_value < min_date:
-            raise ValidationError(f"Date must be on or after {min_date}")
-        
-        if max_date and date_value > max_date:
-            raise ValidationError(f"Date must be on or before {max_date}")
-        
-        return date_value
-    
-    @staticmethod
-    def validate_string(
-        value: Any,
-        min_length: Optional[int] = None,
-        max_length: Optional[int] = None,
-        pattern: Optional[str] = None,
-        allowed_chars: Optional[str] = None,
-        strip: bool = True
-    ) -> str:
-        """
-        Validate and clean a string value.
-        
-        Args:
-            value: Value to validate
-            min_length: Minimum string length
-            max_length: Maximum string length
-            pattern: Regex pattern the string must match
-            allowed_chars: String of allowed characters
-            strip: Whether to strip whitespace
-            
-        Returns:
-            Validated string
-            
-        Raises:
-            ValidationError: If validation fails
-        """
-        if value is None:
-            raise ValidationError("Value cannot be None")
-        
-        str_value = str(value)
-        
-        if strip:
-            str_value = str_value.strip()
-        
-        # Check length constraints
-        if min_length is not None and len(str_value) < min_length:
-            raise ValidationError(f"String must be at least {min_length} characters")
-        
-        if max_length is not None and len(str_value) > max_length:
-            raise ValidationError(f"String must be at most {max_length} characters")
-        
-        # Check pattern
-        if pattern and not re.match(pattern, str_value):
-            raise ValidationError(f"String does not match required pattern")
-        
-        # Check allowed characters
-        if allowed_chars:
-            for char in str_value:
-                if char not in allowed_chars:
-                    raise ValidationError(f"Character '{char}' is not allowed")
-        
-        return str_value
-    
-    @staticmethod
-    def validate_email(value: str) -> str:
-        """
-        Validate an email address.
-        
-        Args:
-            value: Email address to validate
-            
-        Returns:
-            Validated email address (lowercase)
-            
-        Raises:
-            ValidationError: If email is invalid
-        """
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        email = value.strip().lower()
-        
-        if not re.match(email_pattern, email):
-            raise ValidationError(f"Invalid email address: {value}")
-        
-        return email
-    
-    @staticmethod
-    def validate_username(value: str) -> str:
-        """
-        Validate a username.
-        
-        Args:
-            value: Username to validate
-            
-        Returns:
-            Validated username
-            
-        Raises:
-            ValidationError: If username is invalid
-        """
-        username = value.strip()
-        
-        if len(username) < 3:
-            raise ValidationError("Username must be at least 3 characters")
-        
-        if len(username) > 50:
-            raise ValidationError("Username must be at most 50 characters")
-        
-        if not re.match(r'^[a-zA-Z0-9_-]+$', username):
-            raise ValidationError("Username can only contain letters, numbers, hyphens, and underscores")
-        
-        return username
-    
-    @staticmethod
-    def validate_path(
-        value: Union[str, Path],
-        must_exist: bool = False,
-        must_be_file: bool = False,
-        must_be_dir: bool = False,
-        create_parents: bool = False
-    ) -> Path:
-        """
-        Validate a file system path.
-        
-        Args:
-            value: Path to validate
-            must_exist: Whether the path must exist
-            must_be_file: Whether the path must be a file
-            must_be_dir: Whether the path must be a directory
-            create_parents: Whether to create parent directories
-            
-        Returns:
-            Validated Path object
-            
-        Raises:
-            ValidationError: If path is invalid
-        """
-        try:
-            path = Path(value).resolve()
-            
-            if must_exist and not path.exists():
-                raise ValidationError(f"Path does not exist: {path}")
-            
-            if must_be_file and path.exists() and not path.is_file():
-                raise ValidationError(f"Path is not a file: {path}")
-            
-            if must_be_dir and path.exists() and not path.is_dir():
-                raise ValidationError(f"Path is not a directory: {path}")
-            
-            if create_parents and not path.exists():
-                path.parent.mkdir(parents=True, exist_ok=True)
-            
-            return path
-            
-        except Exception as e:
-            raise ValidationError(f"Invalid path: {value} - {e}")
-    
-    @staticmethod
-    def validate_stress_level(value: Any) -> int:
-        """
-        Validate stress level (1-10).
-        
-        Args:
-            value: Stress level to validate
-            
-        Returns:
-            Validated stress level
-            
-        Raises:
-            ValidationError: If stress level is invalid
-        """
-        return Validators.validate_integer(value, min_value=1, max_value=10)
-    
-    @staticmethod
-    def validate_hours_worked(value: Any) -> Decimal:
-        """
-        Validate hours worked (0-24).
-        
-        Args:
-            value: Hours to validate
-            
-        Returns:
-            Validated hours as Decimal
-            
-        Raises:
-            ValidationError: If hours are invalid
-        """
-        return Validators.validate_decimal(
-            value,
-            min_value=Decimal("0"),
-            max_value=Decimal("24"),
-            max_decimal_places=1
-        )
-    
-    @staticmethod
-    def validate_currency(value: Any) -> Decimal:
-        """
-        Validate currency amount.
-        
-        Args:
-            value: Amount to validate
-            
-        Returns:
-            Validated amount as Decimal
-            
-        Raises:
-            ValidationError: If amount is invalid
-        """
-        return Validators.validate_decimal(
-            value,
-            allow_negative=True,  # Allow negative for debts
-            max_decimal_places=2
-        )
-    
-    @staticmethod
-    def sanitize_text(text: str, max_length: int = 5000) -> str:
-        """
-        Sanitize text input for storage.
-        
-        Args:
-            text: Text to sanitize
-            max_length: Maximum allowed length
-            
-        Returns:
-            Sanitized text
-        """
-        if not text:
-            return ""
-        
-        # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        
-        # Normalize whitespace
-        sanitized = re.sub(r'[ \t]+', ' ', sanitized)
-        sanitized = re.sub(r'\n{3,}', '\n\n', sanitized)
-        
-        # Truncate if too long
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length-3] + "..."
-        
-        return sanitized.strip()
 
 
-# Convenience functions
-def validate_entry_data(data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_entries_bulk(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Validate all fields for a daily entry.
+    Validate many daily entries in one pass.
+    
+    The reference date is read once for the whole batch, and repeated field
+    values hit the memoized currency/hours/date parsers.
     
     Args:
-        data: Entry data dictionary
+        rows: Entry data dictionaries
         
     Returns:
-        Validated data dictionary
+        Validated data dictionaries, in input order
         
     Raises:
-        ValidationError: If any field is invalid
+        ValidationError: If any row is invalid (details include the row index)
     """
-    validated = {}
-    
-    # Date
-    if 'date' in data:
-        validated['date'] = Validators.validate_date(data['date'])
-    
-    # Financial fields
-    currency_fields = [
-        'cash_on_hand', 'bank_balance', 'income_today',
-        'bills_due_today', 'debts_total', 'side_income',
-        'food_spent', 'gas_spent'
-    ]
-    
-    for field in currency_fields:
-        if field in data and data[field] is not None:
-            validated[field] = Validators.validate_currency(data[field])
-    
-    # Hours worked
-    if 'hours_worked' in data and data['hours_worked'] is not None:
-        validated['hours_worked'] = Validators.validate_hours_worked(data['hours_worked'])
+    today = date.today()
+    validated_rows = []
     
-    # Stress level
-    if 'stress_level' in data:
-        validated['stress_level'] = Validators.validate_stress_level(data['stress_level'])
-    
-    # Text fields
-    if 'priority' in data and data['priority']:
-        validated['priority'] = Validators.sanitize_text(data['priority'], max_length=255)
-    
-    if 'notes' in data and data['notes']:
-        validated['notes'] = Validators.sanitize_text(data['notes'], max_length=5000)
+    for index, row in enumerate(rows):
+        try:
+            validated_rows.append(validate_entry_data(row, today=today))
+        except ValidationError as e:
+            raise ValidationError(f"Row {index}: {e.message}", details={"row": index}) from e
     
-    return validated
+    return validated_rows
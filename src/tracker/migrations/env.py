@@ -42,7 +42,7 @@ def run_migrations_offline() -> None:
 
     """
     # Get database URL from settings
-    db_path = settings.get_database_path()
+    db_path = settings.database_path
     url = f"sqlite:///{db_path}"
     
     context.configure(
@@ -67,12 +67,26 @@ def run_migrations_online() -> None:
     connectable = get_engine()
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        # batch_alter_table rebuilds SQLite tables with DROP TABLE, which
+        # would fire ON DELETE CASCADE on every child row. Foreign keys can
+        # only be toggled outside a transaction, so switch them off around
+        # the whole migration run.
+        is_sqlite = connection.dialect.name == "sqlite"
+        if is_sqlite:
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+
+        try:
+            context.configure(
+                connection=connection, target_metadata=target_metadata
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if is_sqlite:
+                connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+                connection.commit()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,72 @@
+"""store_user_profile_blobs_as_aes_gcm
+
+Revision ID: 2169e0f7ee3d
+Revises: 6e410c5b59ec
+Create Date: 2026-10-16 13:02:48.417209
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tracker.core.encryption import encryption_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2169e0f7ee3d'
+down_revision: Union[str, Sequence[str], None] = '6e410c5b59ec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENCRYPTED_COLUMNS = (
+    'work_info_encrypted',
+    'financial_info_encrypted',
+    'goals_encrypted',
+    'lifestyle_encrypted',
+    'detected_patterns_encrypted',
+)
+
+
+def _reencrypt(convert, column_type) -> None:
+    """Rewrite every encrypted value with ``convert`` after retyping the columns."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(f"SELECT id, {', '.join(ENCRYPTED_COLUMNS)} FROM user_profiles")
+    ).fetchall()
+
+    with op.batch_alter_table('user_profiles', schema=None) as batch_op:
+        for name in ENCRYPTED_COLUMNS:
+            batch_op.alter_column(name, type_=column_type, existing_nullable=True)
+
+    user_profiles = sa.table(
+        'user_profiles',
+        sa.column('id', sa.Integer()),
+        *(sa.column(name, column_type) for name in ENCRYPTED_COLUMNS),
+    )
+    for row in rows:
+        values = {
+            name: convert(value) if value is not None else None
+            for name, value in zip(ENCRYPTED_COLUMNS, row[1:])
+        }
+        bind.execute(
+            user_profiles.update().where(user_profiles.c.id == row[0]).values(**values)
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fernet base64 text -> raw AES-GCM bytes
+    _reencrypt(
+        lambda value: encryption_service.encrypt_bytes(encryption_service.decrypt(value)),
+        sa.LargeBinary(),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw AES-GCM bytes -> Fernet base64 text
+    _reencrypt(
+        lambda value: encryption_service.encrypt(encryption_service.decrypt_bytes(value)),
+        sa.Text(),
+    )
@@ -0,0 +1,33 @@
+"""drop_indexes_duplicating_uix_user_date
+
+Revision ID: 3a9ea04d28bd
+Revises: 6c64d4ddf7bc
+Create Date: 2026-10-16 15:52:06.385017
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9ea04d28bd'
+down_revision: Union[str, Sequence[str], None] = '6c64d4ddf7bc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uix_user_date (user_id, date) already serves both
+    op.drop_index('ix_daily_entries_user_date', table_name='daily_entries')
+    op.drop_index(op.f('ix_daily_entries_date'), table_name='daily_entries')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_daily_entries_date'), 'daily_entries', ['date'], unique=False)
+    op.create_index(
+        'ix_daily_entries_user_date', 'daily_entries', ['user_id', sa.text('date DESC')], unique=False
+    )
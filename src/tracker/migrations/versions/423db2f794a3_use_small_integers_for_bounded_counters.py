@@ -0,0 +1,48 @@
+"""use_small_integers_for_bounded_counters
+
+Revision ID: 423db2f794a3
+Revises: a8665c63fde8
+Create Date: 2026-10-16 14:20:33.861052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '423db2f794a3'
+down_revision: Union[str, Sequence[str], None] = 'a8665c63fde8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SMALL_COLUMNS = {
+    'daily_entries': ('stress_level',),
+    'user_profiles': (
+        'baseline_energy',
+        'total_entries',
+        'entry_streak',
+        'longest_streak',
+        'profile_version',
+    ),
+}
+
+
+def _retype(old_type, new_type) -> None:
+    for table, columns in SMALL_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=old_type, type_=new_type, existing_nullable=False
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _retype(sa.Integer(), sa.SmallInteger())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _retype(sa.SmallInteger(), sa.Integer())
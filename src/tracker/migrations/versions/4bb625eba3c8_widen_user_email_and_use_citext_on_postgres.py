@@ -0,0 +1,39 @@
+"""widen_user_email_and_use_citext_on_postgres
+
+Revision ID: 4bb625eba3c8
+Revises: 3a9ea04d28bd
+Create Date: 2026-10-16 16:34:19.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4bb625eba3c8'
+down_revision: Union[str, Sequence[str], None] = '3a9ea04d28bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite ignores VARCHAR lengths, so only PostgreSQL needs a change
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    op.alter_column(
+        'users', 'email', existing_type=sa.String(length=255), type_=postgresql.CITEXT(), existing_nullable=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'users', 'email', existing_type=postgresql.CITEXT(), type_=sa.String(length=255), existing_nullable=True
+    )
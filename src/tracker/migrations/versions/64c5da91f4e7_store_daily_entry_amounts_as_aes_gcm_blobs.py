@@ -0,0 +1,66 @@
+"""store_daily_entry_amounts_as_aes_gcm_blobs
+
+Revision ID: 64c5da91f4e7
+Revises: bdd877e04610
+Create Date: 2026-10-16 09:12:41.208316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tracker.core.encryption import encryption_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = '64c5da91f4e7'
+down_revision: Union[str, Sequence[str], None] = 'bdd877e04610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENCRYPTED_COLUMNS = ('cash_on_hand_encrypted', 'bank_balance_encrypted', 'debts_total_encrypted')
+
+
+def _reencrypt(convert, column_type) -> None:
+    """Rewrite every encrypted value with ``convert`` after retyping the columns."""
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(f"SELECT id, {', '.join(ENCRYPTED_COLUMNS)} FROM daily_entries")
+    ).fetchall()
+
+    with op.batch_alter_table('daily_entries', schema=None) as batch_op:
+        for name in ENCRYPTED_COLUMNS:
+            batch_op.alter_column(name, type_=column_type, existing_nullable=True)
+
+    daily_entries = sa.table(
+        'daily_entries',
+        sa.column('id', sa.Integer()),
+        *(sa.column(name, column_type) for name in ENCRYPTED_COLUMNS),
+    )
+    for row in rows:
+        values = {
+            name: convert(value) if value is not None else None
+            for name, value in zip(ENCRYPTED_COLUMNS, row[1:])
+        }
+        bind.execute(
+            daily_entries.update().where(daily_entries.c.id == row[0]).values(**values)
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fernet base64 text -> raw AES-GCM bytes
+    _reencrypt(
+        lambda value: encryption_service.encrypt_bytes(encryption_service.decrypt(value)),
+        sa.LargeBinary(),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw AES-GCM bytes -> Fernet base64 text
+    _reencrypt(
+        lambda value: encryption_service.encrypt(encryption_service.decrypt_bytes(value)),
+        sa.Text(),
+    )
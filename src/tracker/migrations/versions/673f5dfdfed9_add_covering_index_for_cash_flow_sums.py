@@ -0,0 +1,36 @@
+"""add_covering_index_for_cash_flow_sums
+
+Revision ID: 673f5dfdfed9
+Revises: 423db2f794a3
+Create Date: 2026-10-16 14:41:57.203318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '673f5dfdfed9'
+down_revision: Union[str, Sequence[str], None] = '423db2f794a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The covering index starts with (user_id, event_date), so it replaces ix_cfe_user_date
+    op.create_index(
+        'ix_cfe_user_date_type_amount',
+        'cash_flow_events',
+        ['user_id', 'event_date', 'event_type', 'amount_cents'],
+        unique=False,
+    )
+    op.drop_index('ix_cfe_user_date', table_name='cash_flow_events')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_cfe_user_date', 'cash_flow_events', ['user_id', 'event_date'], unique=False)
+    op.drop_index('ix_cfe_user_date_type_amount', table_name='cash_flow_events')
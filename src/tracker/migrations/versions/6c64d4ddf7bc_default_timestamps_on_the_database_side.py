@@ -0,0 +1,53 @@
+"""default_timestamps_on_the_database_side
+
+Revision ID: 6c64d4ddf7bc
+Revises: 72544536ade4
+Create Date: 2026-10-16 15:28:40.117622
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tracker.core.database import utcnow
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c64d4ddf7bc'
+down_revision: Union[str, Sequence[str], None] = '72544536ade4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = {
+    'users': ('created_at',),
+    'daily_entries': ('created_at', 'updated_at'),
+    'ai_feedback': ('created_at', 'updated_at'),
+    'conversation_logs': ('timestamp',),
+    'user_profiles': ('created_at', 'updated_at'),
+    'chats': ('created_at', 'updated_at'),
+    'chat_messages': ('created_at',),
+    'cash_flow_events': ('created_at', 'updated_at'),
+}
+
+
+def _set_server_default(server_default) -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=server_default,
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _set_server_default(utcnow())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_server_default(None)
@@ -0,0 +1,63 @@
+"""store_daily_entry_amounts_as_integers
+
+Revision ID: 6e410c5b59ec
+Revises: fdd4f5411dde
+Create Date: 2026-10-16 11:26:05.931774
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e410c5b59ec'
+down_revision: Union[str, Sequence[str], None] = 'fdd4f5411dde'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (numeric column, integer column, scale, numeric type)
+AMOUNT_COLUMNS = (
+    ('income_today', 'income_today_cents', 100, sa.Numeric(precision=10, scale=2)),
+    ('bills_due_today', 'bills_due_today_cents', 100, sa.Numeric(precision=10, scale=2)),
+    ('hours_worked', 'hours_worked_tenths', 10, sa.Numeric(precision=4, scale=1)),
+    ('side_income', 'side_income_cents', 100, sa.Numeric(precision=10, scale=2)),
+    ('food_spent', 'food_spent_cents', 100, sa.Numeric(precision=10, scale=2)),
+    ('gas_spent', 'gas_spent_cents', 100, sa.Numeric(precision=10, scale=2)),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('daily_entries', schema=None) as batch_op:
+        for _, new, scale, _ in AMOUNT_COLUMNS:
+            column_type = sa.Integer() if scale == 10 else sa.BigInteger()
+            batch_op.add_column(sa.Column(new, column_type, nullable=False, server_default='0'))
+
+    for old, new, scale, _ in AMOUNT_COLUMNS:
+        op.execute(f"UPDATE daily_entries SET {new} = CAST(ROUND({old} * {scale}) AS INTEGER)")
+
+    with op.batch_alter_table('daily_entries', schema=None) as batch_op:
+        batch_op.drop_constraint('check_hours_worked', type_='check')
+        for old, _, _, _ in AMOUNT_COLUMNS:
+            batch_op.drop_column(old)
+        batch_op.create_check_constraint(
+            'check_hours_worked', 'hours_worked_tenths >= 0 AND hours_worked_tenths <= 240'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('daily_entries', schema=None) as batch_op:
+        for old, _, _, numeric_type in AMOUNT_COLUMNS:
+            batch_op.add_column(sa.Column(old, numeric_type, nullable=False, server_default='0'))
+
+    for old, new, scale, _ in AMOUNT_COLUMNS:
+        op.execute(f"UPDATE daily_entries SET {old} = {new} / {scale}.0")
+
+    with op.batch_alter_table('daily_entries', schema=None) as batch_op:
+        batch_op.drop_constraint('check_hours_worked', type_='check')
+        for _, new, _, _ in AMOUNT_COLUMNS:
+            batch_op.drop_column(new)
+        batch_op.create_check_constraint('check_hours_worked', 'hours_worked >= 0 AND hours_worked <= 24')
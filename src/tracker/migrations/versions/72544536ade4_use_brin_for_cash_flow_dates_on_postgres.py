@@ -0,0 +1,42 @@
+"""use_brin_for_cash_flow_dates_on_postgres
+
+Revision ID: 72544536ade4
+Revises: 673f5dfdfed9
+Create Date: 2026-10-16 15:03:12.774590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '72544536ade4'
+down_revision: Union[str, Sequence[str], None] = '673f5dfdfed9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # BRIN only exists on PostgreSQL; other dialects keep the B-tree
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_cash_flow_events_event_date', table_name='cash_flow_events')
+    op.create_index(
+        'ix_cash_flow_events_event_date',
+        'cash_flow_events',
+        ['event_date'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_cash_flow_events_event_date', table_name='cash_flow_events')
+    op.create_index('ix_cash_flow_events_event_date', 'cash_flow_events', ['event_date'], unique=False)
@@ -0,0 +1,86 @@
+"""merge_user_profile_blobs_into_one_column
+
+Revision ID: a8665c63fde8
+Revises: 2169e0f7ee3d
+Create Date: 2026-10-16 13:47:10.592846
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tracker.core.encryption import encryption_service
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8665c63fde8'
+down_revision: Union[str, Sequence[str], None] = '2169e0f7ee3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BLOB_FIELDS = ('work_info', 'financial_info', 'goals', 'lifestyle', 'detected_patterns')
+
+user_profiles = sa.table(
+    'user_profiles',
+    sa.column('id', sa.Integer()),
+    sa.column('profile_blob_encrypted', sa.LargeBinary()),
+    *(sa.column(f'{name}_encrypted', sa.LargeBinary()) for name in BLOB_FIELDS),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('user_profiles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('profile_blob_encrypted', sa.LargeBinary(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(user_profiles.c.id, *(user_profiles.c[f'{name}_encrypted'] for name in BLOB_FIELDS))
+    ).fetchall()
+    for row in rows:
+        data = {
+            name: json.loads(encryption_service.decrypt_bytes(value))
+            for name, value in zip(BLOB_FIELDS, row[1:])
+            if value
+        }
+        if not data:
+            continue
+        blob = encryption_service.encrypt_bytes(zlib.compress(json.dumps(data).encode()))
+        bind.execute(
+            user_profiles.update().where(user_profiles.c.id == row[0]).values(profile_blob_encrypted=blob)
+        )
+
+    with op.batch_alter_table('user_profiles', schema=None) as batch_op:
+        for name in BLOB_FIELDS:
+            batch_op.drop_column(f'{name}_encrypted')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user_profiles', schema=None) as batch_op:
+        for name in BLOB_FIELDS:
+            batch_op.add_column(sa.Column(f'{name}_encrypted', sa.LargeBinary(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(user_profiles.c.id, user_profiles.c.profile_blob_encrypted)
+    ).fetchall()
+    for row_id, blob in rows:
+        if not blob:
+            continue
+        data = json.loads(zlib.decompress(encryption_service.decrypt_raw_bytes(blob)))
+        values = {
+            f'{name}_encrypted': encryption_service.encrypt_bytes(json.dumps(data[name]))
+            for name in BLOB_FIELDS
+            if data.get(name) is not None
+        }
+        if values:
+            bind.execute(
+                user_profiles.update().where(user_profiles.c.id == row_id).values(**values)
+            )
+
+    with op.batch_alter_table('user_profiles', schema=None) as batch_op:
+        batch_op.drop_column('profile_blob_encrypted')
@@ -0,0 +1,35 @@
+"""index_daily_entries_by_user_date_desc
+
+Revision ID: fdd4f5411dde
+Revises: 64c5da91f4e7
+Create Date: 2026-10-16 10:03:17.554920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fdd4f5411dde'
+down_revision: Union[str, Sequence[str], None] = '64c5da91f4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The composite index already covers user_id-only lookups
+    op.drop_index(op.f('ix_daily_entries_user_id'), table_name='daily_entries')
+    op.drop_index('ix_daily_entries_user_date', table_name='daily_entries')
+    op.create_index(
+        'ix_daily_entries_user_date', 'daily_entries', ['user_id', sa.text('date DESC')], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_daily_entries_user_date', table_name='daily_entries')
+    op.create_index('ix_daily_entries_user_date', 'daily_entries', ['user_id', 'date'], unique=False)
+    op.create_index(op.f('ix_daily_entries_user_id'), 'daily_entries', ['user_id'], unique=False)
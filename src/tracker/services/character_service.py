@@ -4,7 +4,7 @@ import json
 from datetime import date, datetime, timedelta
 from typing import Optional, List
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy import func, desc
 
 from tracker.core.models import UserProfile, DailyEntry, User
@@ -51,7 +51,7 @@ class CharacterSheetService:
             career_goals=json.loads(profile.career_goals) if profile.career_goals else [],
             work_challenges=json.loads(profile.work_challenges) if profile.work_challenges else [],
             stress_pattern=profile.stress_pattern or "",
-            stress_triggers=json.loads(profile.stress_triggers) if profile.stress_triggers else [],
+            stress_triggers=profile.stress_triggers or [],
             coping_mechanisms=json.loads(profile.coping_mechanisms) if profile.coping_mechanisms else [],
             baseline_stress=profile.baseline_stress,
             priorities=json.loads(profile.priorities) if profile.priorities else [],
@@ -80,6 +80,7 @@ class CharacterSheetService:
         cutoff_date = date.today() - timedelta(days=lookback_days)
         entries = (
             self.db.query(DailyEntry)
+            .options(undefer_group("encrypted"))
             .filter(DailyEntry.user_id == user_id)
             .filter(DailyEntry.date >= cutoff_date)
             .order_by(desc(DailyEntry.date))
@@ -192,26 +193,23 @@ class CharacterSheetService:
     def _calculate_streak(self, user_id: int) -> int:
         """Calculate current entry streak"""
         today = date.today()
+        # One index-only query for the dates that could be part of the streak
+        # (capped at a year) instead of one query per day
+        dates = (
+            self.db.query(DailyEntry.date)
+            .filter(DailyEntry.user_id == user_id)
+            .filter(DailyEntry.date <= today)
+            .filter(DailyEntry.date >= today - timedelta(days=365))
+            .order_by(DailyEntry.date.desc())
+        )
+        
         streak = 0
         check_date = today
-        
-        while True:
-            entry = (
-                self.db.query(DailyEntry)
-                .filter(DailyEntry.user_id == user_id)
-                .filter(DailyEntry.date == check_date)
-                .first()
-            )
-            
-            if entry:
-                streak += 1
-                check_date -= timedelta(days=1)
-            else:
-                break
-            
-            # Limit to prevent infinite loop
-            if streak > 365:
+        for (entry_date,) in dates:
+            if entry_date != check_date:
                 break
+            streak += 1
+            check_date -= timedelta(days=1)
         
         return streak
     
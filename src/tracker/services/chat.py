@@ -134,9 +134,9 @@ class ChatService:
             if profile.context_depth:
                 context_parts.append(f"Context Depth: {profile.context_depth}")
             if profile.stress_triggers:
-                context_parts.append(f"Stress Triggers: {profile.stress_triggers}")
+                context_parts.append(f"Stress Triggers: {', '.join(profile.stress_triggers)}")
             if profile.calming_activities:
-                context_parts.append(f"Calming Activities: {profile.calming_activities}")
+                context_parts.append(f"Calming Activities: {', '.join(profile.calming_activities)}")
             context_parts.append("")
         
         # Get recent entries (last 7 days) for pattern context
@@ -61,10 +61,12 @@ class EntryService:
             priority=entry_data.priority,
         )
 
-        # Set encrypted fields using property setters
-        entry.cash_on_hand = entry_data.cash_on_hand
-        entry.bank_balance = entry_data.bank_balance
-        entry.debts_total = entry_data.debts_total
+        # Encrypted fields are encrypted together when the session flushes
+        entry.set_encrypted_fields(
+            cash_on_hand=entry_data.cash_on_hand,
+            bank_balance=entry_data.bank_balance,
+            debts_total=entry_data.debts_total,
+        )
 
         try:
             self.db.add(entry)
@@ -129,18 +131,22 @@ class EntryService:
         
         # Update only provided fields (partial update support)
         update_data = entry_data.model_dump(exclude_unset=True)
+        encrypted_updates = {}
         
         for field, value in update_data.items():
             if value is not None:  # Only update non-None values
-                # Handle encrypted fields with property setters
-                if field in ('cash_on_hand', 'bank_balance', 'debts_total'):
-                    setattr(entry, field, value)
+                # Encrypted fields are batched and encrypted at flush time
+                if field in DailyEntry._ENCRYPTED_FIELDS:
+                    encrypted_updates[field] = value
                 elif hasattr(entry, field):
                     old_value = getattr(entry, field)
                     if old_value != value and field in substantial_fields:
                         substantial_change = True
                     setattr(entry, field, value)
         
+        if encrypted_updates:
+            entry.set_encrypted_fields(**encrypted_updates)
+        
         # Preserve created_at, update updated_at
         entry.updated_at = datetime.utcnow()
         
@@ -44,13 +44,11 @@ class ExportService:
         Returns:
             CSV string content (also written to file if filepath provided)
         """
-        # Get entries
-        entries = self.history_service.list_entries(
+        # Stream entries oldest first so only one batch is held at a time
+        entries = self.history_service.iter_entries(
             user_id,
             start_date=start_date,
-            end_date=end_date,
-            limit=10000,  # Get all entries
-            order_desc=False  # Oldest first for exports
+            end_date=end_date
         )
         
         # Create CSV content
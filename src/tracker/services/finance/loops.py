@@ -7,6 +7,7 @@ from datetime import date, timedelta
 from decimal import Decimal
 from typing import Optional
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from tracker.core.models import CashFlowEvent
@@ -223,30 +224,30 @@ def end_of_week_cash(
     Returns:
         End of week balance in cents
     """
-    events = get_events_in_range(db, user_id, start_date, end_date)
+    in_range = (
+        CashFlowEvent.user_id == user_id,
+        CashFlowEvent.event_date >= start_date,
+        CashFlowEvent.event_date <= end_date,
+    )
     
-    balance = starting_balance_cents
+    # Summed in SQL; answered from ix_cfe_user_date_type_amount alone
+    total = db.query(func.coalesce(func.sum(CashFlowEvent.amount_cents), 0)).filter(*in_range).scalar()
     
-    # Get all loop events if we need to exclude them
-    loop_inflow_events = set()
+    # Loop inflows (negative amounts) don't count when excluding loops
     if not include_loops:
-        for loop in config.loops:
-            loop_events = filter_loop_events(events, loop)
-            # Only exclude inflows (negative amounts)
-            for event in loop_events:
-                if event.amount_cents < 0:  # Inflow
-                    loop_inflow_events.add(event.id)
-    
-    # Sum all events
-    for event in events:
-        # Skip loop inflows if include_loops=False
-        if not include_loops and event.id in loop_inflow_events:
-            continue
-        
-        # Negative = inflow (add to balance), Positive = outflow (subtract from balance)
-        balance -= event.amount_cents
+        inflows = db.query(
+            CashFlowEvent.event_type,
+            CashFlowEvent.provider,
+            CashFlowEvent.amount_cents,
+        ).filter(*in_range, CashFlowEvent.amount_cents < 0)
+        total -= sum(
+            row.amount_cents
+            for row in inflows
+            if any(is_event_in_loop(row, loop) for loop in config.loops)
+        )
     
-    return balance
+    # Negative = inflow (add to balance), Positive = outflow (subtract from balance)
+    return starting_balance_cents - total
 
 
 def get_loop_delta_vs_prior_week(
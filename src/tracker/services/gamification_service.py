@@ -10,6 +10,7 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
+from tracker.core.models import DailyEntry
 from tracker.services.history_service import HistoryService
 
 
@@ -102,7 +103,12 @@ class GamificationService:
         achievements = []
         
         # Get user stats
-        entries = self.history_service.list_entries(user_id, limit=10000)
+        entries = (
+            self.history_service.summary_query(user_id)
+            .order_by(DailyEntry.date.desc())
+            .limit(10000)
+            .all()
+        )
         total_entries = len(entries)
         
         streak_info = self.history_service.get_streak_info(user_id)
@@ -2,10 +2,10 @@
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session, load_only, undefer_group
 
 from tracker.core.models import DailyEntry
 
@@ -24,7 +24,8 @@ class HistoryService:
         limit: int = 100,
         offset: int = 0,
         order_by: str = "date",
-        order_desc: bool = True
+        order_desc: bool = True,
+        include_encrypted: bool = True
     ) -> List[DailyEntry]:
         """
         List entries with filtering and pagination
@@ -37,11 +38,14 @@ class HistoryService:
             offset: Number of entries to skip
             order_by: Field to order by (date, stress_level, income_today)
             order_desc: Order descending if True, ascending if False
+            include_encrypted: Load the encrypted balance columns in the same query
             
         Returns:
             List of DailyEntry objects
         """
         query = self.db.query(DailyEntry).filter(DailyEntry.user_id == user_id)
+        if include_encrypted:
+            query = query.options(undefer_group("encrypted"))
         
         # Date filters
         if start_date:
@@ -59,6 +63,63 @@ class HistoryService:
         # Pagination
         return query.offset(offset).limit(limit).all()
 
+    def iter_entries(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 500
+    ) -> Iterator[DailyEntry]:
+        """
+        Stream all entries oldest first, fetching ``batch_size`` rows at a time
+        
+        Only one batch of rows is held in memory, which keeps full-history
+        reports (exports) bounded regardless of how many entries exist.
+        
+        Args:
+            user_id: User ID
+            start_date: Filter entries from this date (inclusive)
+            end_date: Filter entries to this date (inclusive)
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            DailyEntry objects with the encrypted columns loaded
+        """
+        query = (
+            self.db.query(DailyEntry)
+            .options(undefer_group("encrypted"))
+            .filter(DailyEntry.user_id == user_id)
+        )
+        if start_date:
+            query = query.filter(DailyEntry.date >= start_date)
+        if end_date:
+            query = query.filter(DailyEntry.date <= end_date)
+        
+        return iter(query.order_by(DailyEntry.date.asc()).yield_per(batch_size))
+
+    def summary_query(self, user_id: int) -> Query:
+        """
+        Query a user's entries loading only the columns summary views need
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Query over DailyEntry with date, stress and income/bill columns loaded
+        """
+        return (
+            self.db.query(DailyEntry)
+            .options(
+                load_only(
+                    DailyEntry.date,
+                    DailyEntry.stress_level,
+                    DailyEntry.income_today_cents,
+                    DailyEntry.bills_due_today_cents,
+                )
+            )
+            .filter(DailyEntry.user_id == user_id)
+        )
+
     def get_statistics(
         self,
         user_id: int,
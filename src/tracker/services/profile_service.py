@@ -1,11 +1,10 @@
 """User Profile Service for managing personalized context"""
 
-import json
 import statistics
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, Optional, List
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy import and_
 
 from tracker.core.models import User, UserProfile, DailyEntry
@@ -146,9 +145,9 @@ class ProfileService:
         profile = self.get_or_create_profile(user_id)
         
         if stress_triggers is not None:
-            profile.stress_triggers = json.dumps(stress_triggers)
+            profile.stress_triggers = stress_triggers
         if calming_activities is not None:
-            profile.calming_activities = json.dumps(calming_activities)
+            profile.calming_activities = calming_activities
         if baseline_energy is not None:
             profile.baseline_energy = baseline_energy
         if baseline_stress is not None:
@@ -169,13 +168,7 @@ class ProfileService:
         """
         profile = self.get_or_create_profile(user_id)
         
-        milestones = []
-        if profile.milestones:
-            try:
-                milestones = json.loads(profile.milestones)
-            except (json.JSONDecodeError, TypeError):
-                milestones = []
-        
+        milestones = list(profile.milestones or [])
         milestones.append({
             "date": event_date.isoformat(),
             "event_type": event_type,
@@ -183,7 +176,7 @@ class ProfileService:
             "created_at": datetime.utcnow().isoformat()
         })
         
-        profile.milestones = json.dumps(milestones)
+        profile.milestones = milestones
         self.db.commit()
         self.db.refresh(profile)
         return profile
@@ -280,9 +273,9 @@ class ProfileService:
         
         # Add stress triggers and calming activities if available
         if profile.stress_triggers:
-            context["stress_triggers"] = json.loads(profile.stress_triggers)
+            context["stress_triggers"] = profile.stress_triggers
         if profile.calming_activities:
-            context["calming_activities"] = json.loads(profile.calming_activities)
+            context["calming_activities"] = profile.calming_activities
         
         # Include deeper context based on privacy settings
         if profile.context_depth in ["personal", "deep"]:
@@ -409,6 +402,7 @@ class ProfileService:
         cutoff_date = date.today() - timedelta(days=days)
         entries = (
             self.db.query(DailyEntry)
+            .options(undefer_group("encrypted"))
             .filter(
                 and_(
                     DailyEntry.user_id == user_id,
@@ -562,12 +556,8 @@ class ProfileService:
         """
         profile = self.get_or_create_profile(user_id)
         
-        if not profile.milestones:
-            return []
-        
-        try:
-            milestones = json.loads(profile.milestones)
-        except (json.JSONDecodeError, TypeError):
+        milestones = profile.milestones
+        if not milestones:
             return []
         
         # Filter to recent milestones
@@ -588,6 +578,7 @@ class ProfileService:
         cutoff_date = date.today() - timedelta(days=days)
         entries = (
             self.db.query(DailyEntry)
+            .options(undefer_group("encrypted"))
             .filter(
                 and_(
                     DailyEntry.user_id == user_id,